@@ -2,21 +2,24 @@
 Defines the data model for exams, including their types, statuses,
 and an inheritance structure for different examination forms.
 """
-from enum import Enum, auto
-from abc import ABC, abstractmethod
+from enum import Enum, IntEnum, auto
 from datetime import date
 from typing import Optional, List
 
+# Valid range of the German grading system (1.0 is best, 5.0 is worst)
+_GRADE_LO, _GRADE_HI = 1.0, 5.0
+
 class StateError(Exception):
     """
     Custom exception raised when attempting invalid state operations.
     
-    Primarily used when trying to check the pass status of an exam
-    before a grade has been recorded, preventing undefined behavior.
+    Used when trying to check the pass status of an exam before a grade
+    has been recorded, and when adding exams to modules that have already
+    exhausted their maximum allowed attempts.
     """
     pass
 
-class ExamStatus(Enum):
+class ExamStatus(IntEnum):
     """
     Enumeration representing the lifecycle states of an exam attempt.
     
@@ -40,15 +43,25 @@ class ExamType(Enum):
     CASE_STUDY = "Case Study"   # Analysis of real-world scenarios
     ORAL = "Oral Exam"         # Verbal examination with examiner
 
-class Exam(ABC):
+class Exam:
     """
-    Abstract base class for all examination performances.
+    Base class for all examination performances.
     
     This class provides the common structure and behavior for all types
     of exams, including grade recording and status management. Concrete
     exam types inherit from this class and implement specific passing criteria.
+    The class cannot be instantiated directly.
     """
     
+    __slots__ = ('exam_type', 'exam_date', 'grade', 'status', '_module', '_type_name')
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Cache the class name used as the type tag in serialized exams.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+    
     def __init__(self, exam_type: ExamType, exam_date: date):
         """
         Initialize a new exam with type and date.
@@ -56,13 +69,23 @@ class Exam(ABC):
         Args:
             exam_type: The type of examination (written, oral, etc.)
             exam_date: The scheduled date for this exam
+            
+        Raises:
+            TypeError: If Exam itself is instantiated instead of a concrete exam type
         """
+        # Only checked on construction, so isinstance checks stay cheap
+        if type(self) is Exam:
+            raise TypeError("Exam ist eine abstrakte Basisklasse; bitte eine konkrete Prüfungsform verwenden.")
         self.exam_type = exam_type
         self.exam_date = exam_date
+        # Cache the enum name once, it is needed on every serialization
+        self._type_name = exam_type.name
         # Grade will be set when exam results are recorded
         self.grade: Optional[float] = None
         # All exams start as planned until results are recorded
         self.status: ExamStatus = ExamStatus.PLANNED
+        # Owning module, set by CourseModule.add_exam so its cached status can be invalidated
+        self._module = None
     
     def record_result(self, grade: float):
         """
@@ -74,29 +97,51 @@ class Exam(ABC):
         Raises:
             ValueError: If the grade is outside the valid range
         """
-        # Validate grade is within German grading system range
-        if not (1.0 <= grade <= 5.0):
+        # Validate grade is within German grading system range; the chained
+        # comparison is also False for NaN, so NaN is rejected as well
+        if not (_GRADE_LO <= grade <= _GRADE_HI):
             raise ValueError("Note muss zwischen 1.0 (beste) und 5.0 (schlechteste) liegen.")
         
         self.grade = grade
         # Update status based on whether this grade meets passing criteria
-        self.status = ExamStatus.PASSED if self.is_passed() else ExamStatus.FAILED
+        # The outcome cannot change afterwards, so it is frozen into the status
+        self.status = ExamStatus.PASSED if self._compute_passed() else ExamStatus.FAILED
+        # Let the owning module know that its cached status is outdated
+        if self._module is not None:
+            self._module.invalidate_status()
     
-    @abstractmethod
     def is_passed(self) -> bool:
         """
-        Determine if this exam meets the passing criteria.
+        Check whether this exam was passed.
         
-        This abstract method must be implemented by each concrete exam type
-        to define their specific passing requirements.
+        The pass/fail decision is made once in record_result and stored in
+        the status, so this is a simple lookup.
         
         Returns:
-            bool: True if the exam grade meets passing criteria, False otherwise
+            bool: True if the exam grade met the passing criteria, False otherwise
             
         Raises:
             StateError: If called before a grade has been recorded
         """
-        pass
+        if self.status is ExamStatus.PLANNED:
+            raise StateError("Cannot check pass status before a grade is recorded.")
+        return self.status is ExamStatus.PASSED
+    
+    def _compute_passed(self) -> bool:
+        """
+        Determine if the recorded grade meets the passing criteria.
+        
+        This method must be overridden by each concrete exam type
+        to define their specific passing requirements. It is only called
+        after a grade has been recorded.
+        
+        Returns:
+            bool: True if the exam grade meets passing criteria, False otherwise
+            
+        Raises:
+            NotImplementedError: If called on the base class
+        """
+        raise NotImplementedError
 
     def to_dict(self):
         """
@@ -109,8 +154,8 @@ class Exam(ABC):
             dict: Dictionary representation suitable for JSON serialization
         """
         return {
-            '__class__': self.__class__.__name__,  # Enable type identification for deserialization
-            'exam_type': self.exam_type.name,
+            '__class__': self._cls_name,  # Enable type identification for deserialization
+            'exam_type': self._type_name,
             'exam_date': self.exam_date.isoformat(),
             'grade': self.grade,
             'status': self.status.name
@@ -124,6 +169,8 @@ class WrittenExam(Exam):
     with a passing grade threshold of 4.0 or better.
     """
     
+    __slots__ = ()
+    
     def __init__(self, exam_date: date):
         """
         Initialize a written exam for the specified date.
@@ -133,7 +180,7 @@ class WrittenExam(Exam):
         """
         super().__init__(ExamType.WRITTEN, exam_date)
     
-    def is_passed(self) -> bool:
+    def _compute_passed(self) -> bool:
         """
         Check if this written exam meets the passing criteria.
         
@@ -141,12 +188,7 @@ class WrittenExam(Exam):
         
         Returns:
             bool: True if grade <= 4.0, False otherwise
-            
-        Raises:
-            StateError: If called before a grade has been recorded
         """
-        if self.grade is None:
-            raise StateError("Cannot check pass status before a grade is recorded.")
         return self.grade <= 4.0
 
 class Portfolio(Exam):
@@ -157,6 +199,8 @@ class Portfolio(Exam):
     projects, or assignments with a passing grade threshold of 4.0 or better.
     """
     
+    __slots__ = ()
+    
     def __init__(self, exam_date: date):
         """
         Initialize a portfolio exam for the specified date.
@@ -166,7 +210,7 @@ class Portfolio(Exam):
         """
         super().__init__(ExamType.PORTFOLIO, exam_date)
     
-    def is_passed(self) -> bool:
+    def _compute_passed(self) -> bool:
         """
         Check if this portfolio meets the passing criteria.
         
@@ -174,12 +218,7 @@ class Portfolio(Exam):
         
         Returns:
             bool: True if grade <= 4.0, False otherwise
-            
-        Raises:
-            StateError: If called before a grade has been recorded
         """
-        if self.grade is None:
-            raise StateError("Cannot check pass status before a grade is recorded.")
         return self.grade <= 4.0
 
 class CaseStudyExam(Exam):
@@ -190,6 +229,8 @@ class CaseStudyExam(Exam):
     solutions or recommendations with a passing grade threshold of 4.0 or better.
     """
     
+    __slots__ = ()
+    
     def __init__(self, exam_date: date):
         """
         Initialize a case study exam for the specified date.
@@ -199,7 +240,7 @@ class CaseStudyExam(Exam):
         """
         super().__init__(ExamType.CASE_STUDY, exam_date)
     
-    def is_passed(self) -> bool:
+    def _compute_passed(self) -> bool:
         """
         Check if this case study meets the passing criteria.
         
@@ -207,12 +248,7 @@ class CaseStudyExam(Exam):
         
         Returns:
             bool: True if grade <= 4.0, False otherwise
-            
-        Raises:
-            StateError: If called before a grade has been recorded
         """
-        if self.grade is None:
-            raise StateError("Cannot check pass status before a grade is recorded.")
         return self.grade <= 4.0
 
 class OralExam(Exam):
@@ -223,6 +259,8 @@ class OralExam(Exam):
     testing knowledge through spoken interaction with a passing grade threshold of 4.0 or better.
     """
     
+    __slots__ = ()
+    
     def __init__(self, exam_date: date):
         """
         Initialize an oral exam for the specified date.
@@ -232,7 +270,7 @@ class OralExam(Exam):
         """
         super().__init__(ExamType.ORAL, exam_date)
     
-    def is_passed(self) -> bool:
+    def _compute_passed(self) -> bool:
         """
         Check if this oral exam meets the passing criteria.
         
@@ -240,10 +278,5 @@ class OralExam(Exam):
         
         Returns:
             bool: True if grade <= 4.0, False otherwise
-            
-        Raises:
-            StateError: If called before a grade has been recorded
         """
-        if self.grade is None:
-            raise StateError("Cannot check pass status before a grade is recorded.")
         return self.grade <= 4.0
@@ -2,23 +2,14 @@
 Defines the data model for course modules, including their status tracking,
 exam management, and attempt limitations within a degree program.
 """
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import List, Optional
-from .exam import Exam, ExamStatus
+from .exam import Exam, ExamStatus, StateError
 
 # Maximum number of exam attempts allowed per module before permanent failure
 MAX_ATTEMPTS = 3
 
-class StateError(Exception):
-    """
-    Custom exception raised when attempting invalid state transitions.
-    
-    Used primarily when trying to add exams to modules that have already
-    exhausted their maximum allowed attempts.
-    """
-    pass
-
-class ModuleStatus(Enum):
+class ModuleStatus(IntEnum):
     """
     Enumeration representing the lifecycle status of a course module.
     
@@ -44,6 +35,9 @@ class CourseModule:
     tracks multiple exam attempts and dynamically calculates its status.
     """
     
+    __slots__ = ('name', 'credits', 'planned_semester', 'exams', '_status', '_best_grade', '_status_dirty',
+                 '_semester')
+    
     def __init__(self, name: str, credits: int, planned_semester: int):
         """
         Initialize a new course module with validation.
@@ -66,11 +60,35 @@ class CourseModule:
         if planned_semester <= 0:
             raise ValueError("Semester muss positiv sein.")
             
+        self._init_fields(name, credits, planned_semester)
+    
+    @classmethod
+    def _unchecked(cls, name: str, credits: int, planned_semester: int) -> 'CourseModule':
+        """
+        Create a course module from trusted data without validating it.
+        
+        Used when restoring saved data, which was already validated when it
+        was first entered.
+        """
+        obj = cls.__new__(cls)
+        obj._init_fields(name, credits, planned_semester)
+        return obj
+    
+    def _init_fields(self, name: str, credits: int, planned_semester: int):
+        """
+        Assign the attributes of a new instance (shared by __init__ and _unchecked).
+        """
         self.name = name
         self.credits = credits
         self.planned_semester = planned_semester
         # Initialize empty list to track all exam attempts for this module
         self.exams: List[Exam] = []
+        # Cached status and best grade, recalculated lazily after the exams change
+        self._status: ModuleStatus = ModuleStatus.PLANNED
+        self._best_grade: Optional[float] = None
+        self._status_dirty = False
+        # Owning semester, set by Semester.add_module to propagate status changes
+        self._semester = None
 
     def add_exam(self, exam: Exam):
         """
@@ -83,14 +101,45 @@ class CourseModule:
             StateError: If the module has already exhausted all allowed attempts
         """
         # Prevent adding exams if maximum attempts already reached
-        if self.status == ModuleStatus.NO_MORE_ATTEMPTS:
+        if self.status is ModuleStatus.NO_MORE_ATTEMPTS:
             raise StateError(f"Maximale Versuche ({MAX_ATTEMPTS}) für Modul '{self.name}' erreicht")
         self.exams.append(exam)
+        # Register as owner so later grade changes invalidate the cached status
+        exam._module = self
+        self.invalidate_status()
+    
+    def invalidate_status(self):
+        """
+        Mark the cached status and best grade as outdated.
+        
+        Must be called whenever the exam history changes outside of add_exam,
+        e.g. when a grade is recorded or exams are restored from storage.
+        The values are recalculated on the next access. The owning program's
+        cached summary is invalidated as well.
+        """
+        self._status_dirty = True
+        semester = self._semester
+        if semester is not None and semester._program is not None:
+            semester._program.invalidate_summary()
     
     @property
     def status(self) -> ModuleStatus:
         """
-        Calculate the module status dynamically based on its exam history.
+        Get the current module status.
+        
+        The status is cached and only recalculated on the first access after
+        the exam history changed, so reading it is usually a simple attribute lookup.
+        
+        Returns:
+            ModuleStatus: The current status of this module
+        """
+        if self._status_dirty:
+            self._recompute_status()
+        return self._status
+    
+    def _recompute_status(self):
+        """
+        Recalculate the cached status and best grade from the exam history.
         
         The status is determined by the current state of all exams associated
         with this module, following a priority order:
@@ -99,28 +148,41 @@ class CourseModule:
         3. FAILED: If all current exams failed but retries possible
         4. IN_PROGRESS: If exams exist but results are pending/mixed
         5. PLANNED: If no exams have been added yet
-        
-        Returns:
-            ModuleStatus: The current status of this module
         """
-        # Priority 1: Check if any exam has been successfully passed
-        if any(exam.status == ExamStatus.PASSED for exam in self.exams):
-            return ModuleStatus.PASSED
+        exam_count = len(self.exams)
         
-        # Priority 2: Check if maximum attempts reached without passing
-        if len(self.exams) >= MAX_ATTEMPTS:
-            return ModuleStatus.NO_MORE_ATTEMPTS
+        # Track pass/fail flags and the best passed grade in a single pass
+        any_passed = False
+        all_failed = True
+        best_grade = None
+        passed, failed = ExamStatus.PASSED, ExamStatus.FAILED  # Bind once outside the loop
+        for exam in self.exams:
+            exam_status = exam.status
+            if exam_status is passed:
+                any_passed = True
+                grade = exam.grade
+                if grade is not None and (best_grade is None or grade < best_grade):
+                    best_grade = grade
+            elif exam_status is not failed:
+                all_failed = False
+        self._best_grade = best_grade
+        self._status_dirty = False
         
-        # Priority 3: Check if all existing exams failed but retries are possible
-        if self.exams and all(exam.status == ExamStatus.FAILED for exam in self.exams):
-            return ModuleStatus.FAILED
-        
-        # Priority 4: Exams exist but status is mixed or pending
-        if self.exams:
-            return ModuleStatus.IN_PROGRESS
-            
-        # Priority 5: No exams scheduled yet
-        return ModuleStatus.PLANNED
+        if any_passed:
+            # Priority 1: At least one exam has been successfully passed
+            self._status = ModuleStatus.PASSED
+        elif exam_count >= MAX_ATTEMPTS:
+            # Priority 2: Maximum attempts reached without passing
+            self._status = ModuleStatus.NO_MORE_ATTEMPTS
+        elif exam_count and all_failed:
+            # Priority 3: All existing exams failed but retries are possible
+            self._status = ModuleStatus.FAILED
+        elif exam_count:
+            # Priority 4: Exams exist but status is mixed or pending
+            self._status = ModuleStatus.IN_PROGRESS
+        else:
+            # Priority 5: No exams scheduled yet
+            self._status = ModuleStatus.PLANNED
 
     def is_passed(self) -> bool:
         """
@@ -129,7 +191,7 @@ class CourseModule:
         Returns:
             bool: True if the module status is PASSED, False otherwise
         """
-        return self.status == ModuleStatus.PASSED
+        return self.status is ModuleStatus.PASSED
     
     def best_grade(self) -> Optional[float]:
         """
@@ -139,14 +201,14 @@ class CourseModule:
         (1.0 is the best, 5.0 is the worst). This method returns the minimum
         value among all passed exam grades.
         
+        The value is cached and refreshed together with the module status.
+        
         Returns:
             Optional[float]: The best grade achieved, or None if no exams passed
         """
-        # Collect all grades from successfully passed exams
-        passed_grades = [exam.grade for exam in self.exams 
-                         if exam.status == ExamStatus.PASSED and exam.grade is not None]
-        # Return the minimum (best) grade, or None if no passed exams exist
-        return min(passed_grades) if passed_grades else None
+        if self._status_dirty:
+            self._recompute_status()
+        return self._best_grade
     
     def remaining_attempts(self) -> int:
         """
@@ -2,13 +2,31 @@
 Defines the main data model for the degree program, which acts as the root
 container for all academic data.
 """
-from typing import List, Optional
+from bisect import insort
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from .semester import Semester
 from .module import CourseModule, ModuleStatus
 
+_semester_number = attrgetter('number')
+
+# Module statuses that do not accept further exam attempts
+_NON_ELIGIBLE = frozenset({ModuleStatus.PASSED, ModuleStatus.NO_MORE_ATTEMPTS})
+
+class ProgramSummary(NamedTuple):
+    """Key figures of a degree program as shown on the dashboard."""
+    current_semester: int
+    average_grade: Optional[float]
+    total_credits: int
+    achieved_credits: int
+    is_completable: bool
+
 class DegreeProgram:
     """Represents the entire degree program, holding all semesters and modules."""
     
+    __slots__ = ('name', 'target_semesters', 'target_grade', 'semesters', '_semester_index',
+                 '_all_modules_cache', '_summary', '_revision')
+    
     def __init__(self, name: str, target_semesters: int, target_grade: float):
         """
         Initialize a new degree program with validation.
@@ -31,43 +49,221 @@ class DegreeProgram:
         if not (1.0 <= target_grade <= 5.0):
             raise ValueError("Ziel-Notendurchschnitt muss zwischen 1.0 und 5.0 liegen.")
         
+        self._init_fields(name, target_semesters, target_grade)
+    
+    @classmethod
+    def _unchecked(cls, name: str, target_semesters: int, target_grade: float) -> 'DegreeProgram':
+        """
+        Create a degree program from trusted data without validating it.
+        
+        Used when restoring saved data, which was already validated when it
+        was first entered. Only the semester count is still checked, because
+        progress calculations divide by it and an edited file may contain 0.
+        
+        Raises:
+            ValueError: If target_semesters is not positive
+        """
+        if target_semesters <= 0:
+            raise ValueError("Anzahl der Zielsemester muss positiv sein.")
+        obj = cls.__new__(cls)
+        obj._init_fields(name, target_semesters, target_grade)
+        return obj
+    
+    def _init_fields(self, name: str, target_semesters: int, target_grade: float):
+        """
+        Assign the attributes of a new instance (shared by __init__ and _unchecked).
+        """
         self.name = name
         self.target_semesters = target_semesters
         self.target_grade = target_grade
         # Initialize empty list to store all semesters in chronological order
         self.semesters: List[Semester] = []
+        # Semesters by number, maintained by add_semester for constant-time lookup
+        self._semester_index: Dict[int, Semester] = {}
+        # Flattened module tuple, rebuilt lazily after semesters or modules change
+        self._all_modules_cache: Optional[Tuple[CourseModule, ...]] = None
+        # Dashboard figures, recalculated lazily after any change to the program
+        self._summary: Optional[ProgramSummary] = None
+        # Change counter, bumped whenever a cache above is invalidated
+        self._revision = 0
     
     def add_semester(self, semester: Semester):
         """
         Add a semester to the degree program.
         
+        The semester is inserted at its chronological position, so the
+        semester list stays sorted by number without a full re-sort.
+        
         Args:
             semester: The Semester object to add to this program
         """
-        self.semesters.append(semester)
+        semesters = self.semesters
+        if not semesters or semesters[-1].number <= semester.number:
+            # Common case: semesters are added (or loaded) in order
+            semesters.append(semester)
+        else:
+            insort(semesters, semester, key=_semester_number)
+        # First one wins if a (hand-edited) file contains a number twice
+        self._semester_index.setdefault(semester.number, semester)
+        # Register as owner so modules added later invalidate the module cache
+        semester._program = self
+        self.invalidate_modules()
+    
+    def get_semester(self, number: int) -> Optional[Semester]:
+        """
+        Look up a semester by its number.
+        
+        Args:
+            number: The semester number to look for
+            
+        Returns:
+            Optional[Semester]: The matching semester (the first one added if the
+                                number occurs twice), or None if it does not exist
+        """
+        return self._semester_index.get(number)
     
-    def get_all_modules(self) -> List[CourseModule]:
+    def invalidate_modules(self):
         """
-        Return a flat list of all modules in all semesters.
+        Discard the cached flat module tuple.
         
-        This method aggregates modules from all semesters into a single list,
-        useful for program-wide calculations and analysis.
+        Called whenever a semester or module is added; the list is rebuilt
+        on the next call to get_all_modules. The cached summary depends on
+        the module list and is discarded too.
+        """
+        self._all_modules_cache = None
+        self._summary = None
+        self._revision += 1
+    
+    def invalidate_summary(self):
+        """
+        Discard the cached program summary.
+        
+        Called by modules whenever their exam history changes; the summary
+        is recalculated on the next call to get_summary.
+        """
+        self._summary = None
+        self._revision += 1
+    
+    @property
+    def revision(self) -> int:
+        """
+        Get a counter that changes whenever semesters, modules or exams change.
+        
+        Views can compare it with a stored value to reuse output built for an
+        unchanged program.
         
         Returns:
-            List[CourseModule]: All modules from all semesters combined
+            int: The current revision number
         """
-        all_modules = []
-        # Iterate through each semester and collect all its modules
+        return self._revision
+    
+    def get_summary(self) -> ProgramSummary:
+        """
+        Get the key figures of the program for display.
+        
+        The summary is cached and only recalculated after a semester, module
+        or exam was added or an exam was graded, so repeated dashboard renders
+        without changes do not repeat any aggregation.
+        
+        Returns:
+            ProgramSummary: Current semester, average grade, credit totals
+                            and completability of the program
+        """
+        if self._summary is None:
+            self._summary = self._calculate_summary()
+        return self._summary
+    
+    def _calculate_summary(self) -> ProgramSummary:
+        """
+        Calculate all dashboard figures in a single pass over the modules.
+        
+        This is the only implementation of the current semester, average
+        grade and completability rules; current_semester, get_average_grade
+        and is_completable return the matching fields of the cached result.
+        
+        Returns:
+            ProgramSummary: Freshly calculated program figures
+        """
+        passed = ModuleStatus.PASSED
+        no_more_attempts = ModuleStatus.NO_MORE_ATTEMPTS
+        total_credits = achieved_credits = graded_credits = 0
+        total_weighted_grade = 0.0
+        earliest_open = None
+        is_completable = True
+        module_count = 0
+        
         for semester in self.semesters:
-            all_modules.extend(semester.modules)
-        return all_modules
+            for module in semester.modules:
+                module_count += 1
+                credits = module.credits
+                total_credits += credits
+                status = module.status
+                if status is passed:
+                    achieved_credits += credits
+                    best_grade = module.best_grade()
+                    if best_grade is not None:
+                        total_weighted_grade += best_grade * credits
+                        graded_credits += credits
+                else:
+                    # Open modules determine the current semester and completability
+                    planned = module.planned_semester
+                    if earliest_open is None or planned < earliest_open:
+                        earliest_open = planned
+                    if status is no_more_attempts:
+                        is_completable = False
+        
+        if module_count == 0:
+            current_semester = 1
+        elif earliest_open is None:
+            current_semester = self.target_semesters
+        else:
+            current_semester = earliest_open
+        
+        return ProgramSummary(
+            current_semester=current_semester,
+            average_grade=round(total_weighted_grade / graded_credits, 2) if graded_credits else None,
+            total_credits=total_credits,
+            achieved_credits=achieved_credits,
+            is_completable=is_completable
+        )
+    
+    def get_all_modules(self) -> Tuple[CourseModule, ...]:
+        """
+        Return a flat sequence of all modules in all semesters.
+        
+        This method aggregates modules from all semesters into a single tuple,
+        useful for program-wide calculations and analysis. The tuple is cached
+        until a semester or module is added; being immutable, it can be shared
+        safely between callers.
+        
+        Returns:
+            Tuple[CourseModule, ...]: All modules from all semesters combined
+        """
+        if self._all_modules_cache is None:
+            # Collect the modules of each semester in chronological order
+            self._all_modules_cache = tuple(
+                module for semester in self.semesters for module in semester.modules
+            )
+        return self._all_modules_cache
+
+    def get_eligible_modules(self) -> List[CourseModule]:
+        """
+        Get all modules that can still take a new exam attempt.
+        
+        Modules that are already passed or have no attempts left are excluded.
+        
+        Returns:
+            List[CourseModule]: Eligible modules in chronological order
+        """
+        return [module for module in self.get_all_modules() if module.status not in _NON_ELIGIBLE]
 
     def current_semester(self) -> int:
         """
         Determine the current semester based on unpassed modules.
         
         The current semester is determined by finding the earliest semester
-        that still contains modules that haven't been passed yet.
+        that still contains modules that haven't been passed yet. The value
+        is taken from the cached program summary.
         
         Returns:
             int: The current semester number (1-indexed)
@@ -75,24 +271,7 @@ class DegreeProgram:
                  - Returns target_semesters if all modules are passed
                  - Otherwise returns the lowest semester with unpassed modules
         """
-        all_modules = self.get_all_modules()
-        # If no modules exist yet, student is in first semester
-        if not all_modules:
-            return 1
-        
-        # Find all semesters that have modules not yet passed
-        open_semester_numbers = {
-            module.planned_semester 
-            for module in all_modules 
-            if not module.is_passed()
-        }
-        
-        # If all modules are passed, student is in final semester
-        if not open_semester_numbers:
-            return self.target_semesters
-        
-        # Return the earliest semester with unpassed modules
-        return min(open_semester_numbers)
+        return self.get_summary().current_semester
     
     def get_average_grade(self) -> Optional[float]:
         """
@@ -101,29 +280,13 @@ class DegreeProgram:
         The average is weighted by credit points (ECTS), so modules with more
         credits have a proportionally larger impact on the overall grade.
         Only considers the best grade for each module if multiple attempts exist.
+        The value is taken from the cached program summary.
         
         Returns:
             Optional[float]: Weighted average grade rounded to 2 decimal places,
                            or None if no modules have been passed yet
         """
-        total_weighted_grade = 0.0
-        total_credits = 0
-        
-        # Sum up weighted grades for all passed modules
-        for module in self.get_all_modules():
-            if module.is_passed():
-                best_grade = module.best_grade()
-                if best_grade is not None:
-                    # Weight the grade by the module's credit points
-                    total_weighted_grade += best_grade * module.credits
-                    total_credits += module.credits
-        
-        # Return None if no modules have been completed yet
-        if total_credits == 0:
-            return None
-        
-        # Calculate and round the weighted average
-        return round(total_weighted_grade / total_credits, 2)
+        return self.get_summary().average_grade
     
     def is_completable(self) -> bool:
         """
@@ -131,15 +294,13 @@ class DegreeProgram:
         
         A degree becomes incompletable when any required module has exhausted
         all allowed attempts without passing (NO_MORE_ATTEMPTS status).
+        The value is taken from the cached program summary.
         
         Returns:
             bool: True if the degree can still be completed, False if any
                   module has reached the maximum failure limit
         """
-        return not any(
-            module.status == ModuleStatus.NO_MORE_ATTEMPTS
-            for module in self.get_all_modules()
-        )
+        return self.get_summary().is_completable
     
     def get_critical_failures(self) -> List[CourseModule]:
         """
@@ -153,7 +314,7 @@ class DegreeProgram:
         """
         return [
             module for module in self.get_all_modules()
-            if module.status == ModuleStatus.NO_MORE_ATTEMPTS
+            if module.status is ModuleStatus.NO_MORE_ATTEMPTS
         ]
     
     def to_dict(self):
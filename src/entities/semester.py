@@ -13,6 +13,8 @@ class Semester:
     for calculating total credits and tracking completion progress.
     """
     
+    __slots__ = ('number', 'modules', '_program', '_total_credits')
+    
     def __init__(self, number: int):
         """
         Initialize a new semester with validation.
@@ -26,9 +28,37 @@ class Semester:
         # Validate semester number is positive (1-indexed system)
         if number <= 0:
             raise ValueError("Semester-Nummer muss positiv sein.")
+        self._init_fields(number)
+    
+    @classmethod
+    def _unchecked(cls, number: int) -> 'Semester':
+        """
+        Create a semester from trusted data without validating it.
+        
+        Used when restoring saved data, which was already validated when it
+        was first entered. The cheap range check on the number is kept for
+        edited files.
+        
+        Raises:
+            ValueError: If the semester number is not positive
+        """
+        if number <= 0:
+            raise ValueError("Semester-Nummer muss positiv sein.")
+        obj = cls.__new__(cls)
+        obj._init_fields(number)
+        return obj
+    
+    def _init_fields(self, number: int):
+        """
+        Assign the attributes of a new instance (shared by __init__ and _unchecked).
+        """
         self.number = number
         # Initialize empty list to hold all modules for this semester
         self.modules: List[CourseModule] = []
+        # Owning program, set by DegreeProgram.add_semester to invalidate its module cache
+        self._program = None
+        # Running credit total, maintained by add_module
+        self._total_credits = 0
     
     def add_module(self, module: CourseModule):
         """
@@ -38,18 +68,24 @@ class Semester:
             module: The CourseModule to add to this semester
         """
         self.modules.append(module)
+        self._total_credits += module.credits
+        # Register as owner so status changes reach the program's cached summary
+        module._semester = self
+        if self._program is not None:
+            self._program.invalidate_modules()
 
     def total_credits(self) -> int:
         """
         Calculate the total ECTS credits of all modules in this semester.
         
         Sums up the credit points from all modules planned for this semester,
-        regardless of their completion status.
+        regardless of their completion status. The total is kept up to date
+        by add_module, so no iteration is needed.
         
         Returns:
             int: Total ECTS credit points for this semester
         """
-        return sum(module.credits for module in self.modules)
+        return self._total_credits
     
     def get_achieved_credits(self) -> int:
         """
@@ -61,11 +97,12 @@ class Semester:
         Returns:
             int: Total ECTS credits from passed modules in this semester
         """
-        return sum(
-            module.credits 
-            for module in self.modules 
-            if module.is_passed()
-        )
+        passed = ModuleStatus.PASSED  # Bind once outside the loop
+        achieved = 0
+        for module in self.modules:
+            if module.status is passed:
+                achieved += module.credits
+        return achieved
     
     def to_dict(self):
         """
@@ -1,7 +1,6 @@
 """
 Contains the main application controller that orchestrates the different services.
 """
-from src.services.progress_analyzer import ProgressAnalyzer
 from src.services.data_manager import DataManager
 from src.services.ui_service import DashboardUI
 from src.entities.program import DegreeProgram
@@ -10,6 +9,32 @@ from src.entities.module import CourseModule, ModuleStatus, MAX_ATTEMPTS
 from src.entities.exam import WrittenExam, Portfolio, CaseStudyExam, OralExam
 from src.utils.validation import get_validated_input
 from datetime import date
+from rich.text import Text
+
+# Exam classes by their number in the exam type menu
+_EXAM_FACTORIES = {1: WrittenExam, 2: Portfolio, 3: CaseStudyExam, 4: OralExam}
+
+# Static messages, parsed once instead of on every print
+_MSG_NO_PROGRAM = Text.from_markup("\n[bold red]Fehler:[/bold red] Bitte zuerst einen Studiengang anlegen.")
+_MSG_NO_MODULES = Text.from_markup("\n[bold red]Fehler:[/bold red] Bitte zuerst einen Studiengang mit Modulen anlegen.")
+_MSG_PROGRAM_CREATED = Text.from_markup("\n[bold green]✔ Studiengang wurde erfolgreich angelegt und gespeichert.[/bold green]")
+_MSG_NO_ELIGIBLE_MODULES = Text.from_markup(
+    "\n[bold yellow]Keine Module verfügbar:[/bold yellow]\n"
+    "- Alle Module sind bestanden oder haben keine Versuche mehr\n"
+    "- Fügen Sie zuerst neue Module hinzu"
+)
+_MSG_MODULE_SELECTION = Text.from_markup("\n[bold]Modulauswahl für Prüfungsleistung[/bold]")
+_MSG_INVALID_SELECTION = Text.from_markup("\n[bold red]Ungültige Auswahl.[/bold red]")
+_MSG_EXAM_TYPE_MENU = Text(
+    "\nPrüfungsart auswählen:\n"
+    "[1] Schriftliche Prüfung\n"
+    "[2] Portfolio\n"
+    "[3] Fallstudie\n"
+    "[4] Mündliche Prüfung"
+)
+_MSG_INVALID_EXAM_TYPE = Text.from_markup("\n[bold red]Ungültige Prüfungsart.[/bold red]")
+_MSG_GOODBYE = Text("\nProgramm wird beendet. Auf Wiedersehen!", style="bold blue")
+_PROMPT_CONTINUE = Text.from_markup("\n[cyan]Drücke Enter, um fortzufahren...[/cyan]")
 
 class AppController:
     """
@@ -36,6 +61,20 @@ class AppController:
         
         # Current program state (loaded from file or created new)
         self.program: DegreeProgram | None = None
+        # Set by handlers that modify the program; the data file is only
+        # written when there are unsaved changes
+        self._dirty = False
+        # Analysis results, cached per program, program revision and day
+        self._analysis_cache: tuple | None = None
+        
+        # Menu dispatch table, built once; '6' (exit) is handled in _loop()
+        self._dispatch = {
+            '1': self._add_new_module,
+            '2': self._add_new_exam,
+            '3': self._show_modules,
+            '4': self._show_analysis,
+            '5': self._create_new_program,
+        }
 
     def run(self):
         """
@@ -48,46 +87,86 @@ class AppController:
         4. Continue until user chooses to exit
         
         The loop ensures proper state management and user experience flow.
+        Pending changes are saved when the loop ends.
         """
         # Load existing program data or start with None if no data exists
         self.program = self.data_manager.load_program(self.data_filepath)
     
         # Main application loop - continues until user exits
+        try:
+            self._loop()
+        finally:
+            # Never lose pending changes, even if the loop is left by an error
+            self._flush()
+
+    def _loop(self):
+        """
+        Run the menu loop until the user chooses to exit.
+        
+        Changes made by a handler are saved right after it returns, so no
+        entered data is lost if the program is terminated afterwards.
+        """
+        redraw = True
         while True:
-            # Display current program status and statistics
-            self.ui.display_dashboard(self.program)
+            # Display current program status and statistics, unless it is
+            # still on screen from the previous iteration
+            if redraw:
+                self.ui.display_dashboard(self.program)
             
             # Show menu options and get user selection
             choice = self.ui.display_main_menu()
             
             # Process user choice and delegate to appropriate handler
-            if choice == '1':
-                self._add_new_module()
-            elif choice == '2':
-                self._add_new_exam()
-            elif choice == '3':
-                # Module overview requires existing program data
-                if self.program:
-                    self.ui.display_module_table(self.program)
-                else:
-                    self.ui.console.print("\n[bold red]Fehler:[/bold red] Bitte zuerst einen Studiengang anlegen.")
-            elif choice == '4':
-                self._show_analysis()
-            elif choice == '5':
-                # Create new program and reload from storage
-                self._create_new_program()
-                self.program = self.data_manager.load_program(self.data_filepath)
+            handler = self._dispatch.get(choice)
+            if handler is not None:
+                handler()
             elif choice == '6':
                 # Graceful application exit
-                self.ui.console.print("\nProgramm wird beendet. Auf Wiedersehen!", style="bold blue")
+                self.ui.console.print(_MSG_GOODBYE)
                 break
             else:
-                # Handle invalid menu selections
-                self.ui.console.print(f"\n'[bold red]{choice}[/bold red]' ist keine gültige Option.")
+                # Handle invalid menu selections; nothing changed and the
+                # dashboard is still visible, so just ask again below it
+                self.ui.console.print(Text.assemble("\n'", (choice, "bold red"), "' ist keine gültige Option."))
+                redraw = False
+                continue
+            
+            self._flush()
             
             # Pause for user acknowledgment before continuing to next iteration
-            self.ui.console.input("\n[cyan]Drücke Enter, um fortzufahren...[/cyan]")
+            self.ui.console.input(_PROMPT_CONTINUE)
             self.ui.console.clear()  # Clear screen for clean next iteration
+            redraw = True
+
+    def _mark_changed(self):
+        """
+        Record that the program was modified.
+        
+        The change is saved as soon as the current handler returns. The
+        cached analysis does not depend on this flag, it follows
+        DegreeProgram.revision.
+        """
+        self._dirty = True
+
+    def _flush(self):
+        """
+        Write pending changes of the current program to the data file.
+        """
+        if self._dirty and self.program is not None:
+            self.data_manager.save_program(self.program, self.data_filepath)
+            self._dirty = False
+
+    def _show_modules(self):
+        """
+        Display the module overview table of the current program.
+        
+        The overview requires existing program data; otherwise an error
+        message is shown.
+        """
+        if self.program:
+            self.ui.display_module_table(self.program)
+        else:
+            self.ui.console.print(_MSG_NO_PROGRAM)
 
     def _create_new_program(self):
         """
@@ -111,11 +190,12 @@ class AppController:
             target_grade=program_data["target_grade"]
         )
         
-        # Persist the new program to storage
-        self.data_manager.save_program(self.program, self.data_filepath)
+        # Persist the new program right away, it replaces any existing data file
+        self._mark_changed()
+        self._flush()
         
         # Provide success feedback to user
-        self.ui.console.print("\n[bold green]✔ Studiengang wurde erfolgreich angelegt und gespeichert.[/bold green]")
+        self.ui.console.print(_MSG_PROGRAM_CREATED)
         
     def _add_new_module(self):
         """
@@ -133,7 +213,7 @@ class AppController:
         """
         # Ensure a program exists before allowing module creation
         if not self.program:
-            self.ui.console.print("\n[bold red]Fehler:[/bold red] Bitte zuerst einen Studiengang anlegen.")
+            self.ui.console.print(_MSG_NO_PROGRAM)
             return
 
         # Collect module details from user through UI service
@@ -141,14 +221,13 @@ class AppController:
         semester_num = module_data["semester_num"]
 
         # Find existing semester or prepare to create a new one
-        target_semester = next((s for s in self.program.semesters if s.number == semester_num), None)
+        target_semester = self.program.get_semester(semester_num)
         
         # Create semester if it doesn't exist
         if not target_semester:
             target_semester = Semester(number=semester_num)
+            # add_semester keeps the semesters in chronological order
             self.program.add_semester(target_semester)
-            # Maintain chronological order of semesters
-            self.program.semesters.sort(key=lambda s: s.number)
 
         # Create new module entity with validation
         new_module = CourseModule(
@@ -160,8 +239,8 @@ class AppController:
         # Add module to the target semester
         target_semester.add_module(new_module)
         
-        # Persist changes to storage
-        self.data_manager.save_program(self.program, self.data_filepath)
+        # Mark changes for the next save
+        self._mark_changed()
         
         # Provide success feedback to user
         self.ui.console.print(f"\n[bold green]✔ Modul '{new_module.name}' wurde zu Semester {semester_num} hinzugefügt.[/bold green]")
@@ -183,78 +262,63 @@ class AppController:
         """
         # Validate that program exists and has modules before proceeding
         if not self.program or not self.program.get_all_modules():
-            self.ui.console.print("\n[bold red]Fehler:[/bold red] Bitte zuerst einen Studiengang mit Modulen anlegen.")
+            self.ui.console.print(_MSG_NO_MODULES)
             return
 
         # Filter modules that are eligible for new exam attempts
         # Exclude: already passed modules and modules with no attempts left
-        eligible_modules = [
-            m for m in self.program.get_all_modules()
-            if m.status != ModuleStatus.PASSED and m.status != ModuleStatus.NO_MORE_ATTEMPTS
-        ]
+        eligible_modules = self.program.get_eligible_modules()
         
         # Check if any modules are eligible for new exams
         if not eligible_modules:
-            self.ui.console.print("\n[bold yellow]Keine Module verfügbar:[/bold yellow]")
-            self.ui.console.print("- Alle Module sind bestanden oder haben keine Versuche mehr")
-            self.ui.console.print("- Fügen Sie zuerst neue Module hinzu")
+            self.ui.console.print(_MSG_NO_ELIGIBLE_MODULES)
             return
 
         # Present eligible modules to user with status indicators
-        self.ui.console.print("\n[bold]Modulauswahl für Prüfungsleistung[/bold]")
+        self.ui.console.print(_MSG_MODULE_SELECTION)
         for idx, module in enumerate(eligible_modules, start=1):
             # Add warning icon for failed modules to draw attention
             status_icon = ""
-            if module.status == ModuleStatus.FAILED:
+            if module.status is ModuleStatus.FAILED:
                 status_icon = "[yellow]⚠[/yellow] "
             self.ui.console.print(f"[{idx}] {status_icon}{module.name} (Status: {module.status.name}, Verbleibende Versuche: {module.remaining_attempts()})")
 
         # Get user's module selection with validation
         choice = get_validated_input("Zu welchem Modul soll die Prüfungsleistung hinzugefügt werden? ", int)
         if choice < 1 or choice > len(eligible_modules):
-            self.ui.console.print("\n[bold red]Ungültige Auswahl.[/bold red]")
+            self.ui.console.print(_MSG_INVALID_SELECTION)
             return
 
         # Get the selected module for exam addition
         selected_module = eligible_modules[choice - 1]
         
         # Present exam type options to the user
-        self.ui.console.print("\nPrüfungsart auswählen:")
-        self.ui.console.print("[1] Schriftliche Prüfung")
-        self.ui.console.print("[2] Portfolio")
-        self.ui.console.print("[3] Fallstudie")
-        self.ui.console.print("[4] Mündliche Prüfung")
+        self.ui.console.print(_MSG_EXAM_TYPE_MENU)
         exam_type_choice = get_validated_input("Deine Wahl: ", int)
 
         # Create appropriate exam object based on user selection
         # All exams use today's date as the exam date
-        if exam_type_choice == 1:
-            exam = WrittenExam(date.today())
-        elif exam_type_choice == 2:
-            exam = Portfolio(date.today())
-        elif exam_type_choice == 3:
-            exam = CaseStudyExam(date.today())
-        elif exam_type_choice == 4:
-            exam = OralExam(date.today())
-        else:
-            self.ui.console.print("\n[bold red]Ungültige Prüfungsart.[/bold red]")
+        exam_class = _EXAM_FACTORIES.get(exam_type_choice)
+        if exam_class is None:
+            self.ui.console.print(_MSG_INVALID_EXAM_TYPE)
             return
+        exam = exam_class(date.today())
 
         # Collect and record the exam grade with validation
         grade = get_validated_input("Note der Prüfungsleistung: ", float)
         try:
             # Record the result, which automatically updates exam status
             exam.record_result(grade)
-        except Exception as e:
-            # Handle validation errors from grade recording
+        except ValueError as e:
+            # Handle validation errors from grade recording (grade out of range)
             self.ui.console.print(f"[bold red]Fehler:[/bold red] {e}")
             return
 
         # Add the completed exam to the selected module
         selected_module.add_exam(exam)
         
-        # Persist all changes to storage
-        self.data_manager.save_program(self.program, self.data_filepath)
+        # Mark changes for the next save
+        self._mark_changed()
         
         # Provide success feedback and show remaining attempts
         self.ui.console.print(f"\n[bold green]✔ Prüfungsleistung für Modul '{selected_module.name}' hinzugefügt.[/bold green]")
@@ -275,23 +339,33 @@ class AppController:
         """
         # Ensure program exists before attempting analysis
         if not self.program:
-            self.ui.console.print("\n[bold red]Fehler:[/bold red] Bitte zuerst einen Studiengang mit Modulen anlegen.")
+            self.ui.console.print(_MSG_NO_MODULES)
             return
         
-        # Create analyzer instance for the current program
-        analyzer = ProgressAnalyzer(self.program)
-        
-        # Calculate ECTS accumulation trend (on track, behind, etc.)
-        trend = analyzer.calculate_ects_trend()
-        
-        # Predict graduation date based on current progress
-        grad_date = analyzer.predict_graduation()
-        
-        # Identify modules that require attention (failed, overdue, low attempts)
-        risk_modules = analyzer.identify_risk_modules()
-        
-        # Get modules that permanently prevent degree completion
-        critical_failures = self.program.get_critical_failures()
+        # Reuse the results while neither the program nor the date has changed;
+        # the revision covers every semester, module and exam change
+        cache_key = (self.program, self.program.revision, date.today())
+        if self._analysis_cache is None or self._analysis_cache[0] != cache_key:
+            # Imported on first use; sessions without an analysis never load it
+            from src.services.progress_analyzer import ProgressAnalyzer
+            
+            # Create analyzer instance for the current program
+            analyzer = ProgressAnalyzer(self.program)
+            
+            # Calculate ECTS accumulation trend (on track, behind, etc.)
+            trend = analyzer.calculate_ects_trend()
+            
+            # Predict graduation date based on current progress
+            grad_date = analyzer.predict_graduation()
+            
+            # Identify modules that require attention (failed, overdue, low attempts)
+            risk_modules = analyzer.identify_risk_modules()
+            
+            # Get modules that permanently prevent degree completion
+            critical_failures = self.program.get_critical_failures()
+            
+            self._analysis_cache = (cache_key, (trend, grad_date, risk_modules, critical_failures))
+        trend, grad_date, risk_modules, critical_failures = self._analysis_cache[1]
         
         # Delegate display formatting to the UI service
         self.ui.display_analysis(self.program, trend, grad_date, risk_modules, critical_failures)
\ No newline at end of file
@@ -7,8 +7,15 @@ reconstruction of all nested objects with their relationships intact.
 """
 import json
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
+try:
+    # orjson is an optional, much faster drop-in for reading and writing the JSON file
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import all entity classes for deserialization
 from src.entities.program import DegreeProgram
 from src.entities.semester import Semester
@@ -36,73 +43,126 @@ def from_dict_hook(d: dict) -> Any:
 
     # Extract class name and remove it from data (consumed by reconstruction)
     class_name = d.pop("__class__")
-    obj = None
+    builder = _BUILDERS.get(class_name)
+    # Return the reconstructed object (or None if class_name not recognized)
+    return builder(d) if builder is not None else None
 
-    # === Reconstruct Exam objects ===
-    # Each exam type requires special handling for grade and status restoration
-    if class_name == "WrittenExam":
-        obj = WrittenExam(exam_date=date.fromisoformat(d['exam_date']))
-        # Restore grade and status if exam has been completed
-        if 'grade' in d and d['grade'] is not None:
-            obj.grade = d['grade']
-            obj.status = ExamStatus[d['status']]
-            
-    elif class_name == "Portfolio":
-        obj = Portfolio(exam_date=date.fromisoformat(d['exam_date']))
-        # Restore grade and status for completed portfolio submissions
-        if 'grade' in d and d['grade'] is not None:
-            obj.grade = d['grade']
-            obj.status = ExamStatus[d['status']]
-            
-    elif class_name == "CaseStudyExam":
-        obj = CaseStudyExam(exam_date=date.fromisoformat(d['exam_date']))
-        # Restore grade and status for completed case studies
-        if 'grade' in d and d['grade'] is not None:
-            obj.grade = d['grade']
-            obj.status = ExamStatus[d['status']]
-            
-    elif class_name == "OralExam":
-        obj = OralExam(exam_date=date.fromisoformat(d['exam_date']))
-        # Restore grade and status for completed oral examinations
-        if 'grade' in d and d['grade'] is not None:
-            obj.grade = d['grade']
-            obj.status = ExamStatus[d['status']]
+# Direct name-to-member mapping, avoids the EnumMeta.__getitem__ call per exam
+_EXAM_STATUS = ExamStatus.__members__
 
-    # === Reconstruct CourseModule ===
-    elif class_name == "CourseModule":
-        # Create module with basic metadata
-        obj = CourseModule(
-            name=d['name'], 
-            credits=d['credits'], 
-            planned_semester=d['planned_semester']
-        )
-        # Reconstruct and add all exams (status will be calculated dynamically)
-        # We use append instead of add_exam to avoid attempt validation during deserialization
-        for exam_dict in d['exams']:
-            exam = from_dict_hook(exam_dict)
-            obj.exams.append(exam)
+@lru_cache(maxsize=512)
+def _parse_date(iso_string: str) -> date:
+    """
+    Parse an ISO date string, reusing the result for repeated dates.
+    
+    Exams of the same session share their date, so most strings in a
+    saved program repeat. Dates are immutable and safe to share.
+    
+    Args:
+        iso_string: Date in ISO format (YYYY-MM-DD)
+        
+    Returns:
+        date: The parsed date
+    """
+    return date.fromisoformat(iso_string)
 
-    # === Reconstruct Semester ===
-    elif class_name == "Semester":
-        # Create semester with semester number
-        obj = Semester(number=d['number'])
-        # Recursively reconstruct all modules in this semester
-        obj.modules = [from_dict_hook(mod_dict) for mod_dict in d['modules']]
+def _finish_exam(exam, d: dict):
+    """
+    Restore grade and status of a reconstructed exam if it has been completed.
+    
+    Args:
+        exam: The newly created exam object
+        d: Dictionary produced by Exam.to_dict
+        
+    Returns:
+        The exam object, for use in expressions
+    """
+    grade = d.get('grade')
+    if grade is not None:
+        exam.grade = grade
+        exam.status = _EXAM_STATUS[d['status']]
+    return exam
 
-    # === Reconstruct DegreeProgram ===
-    elif class_name == "DegreeProgram":
-        # Create program with metadata and validation
-        obj = DegreeProgram(
-            name=d['name'],
-            target_semesters=d['target_semesters'],
-            target_grade=d['target_grade']
-        )
-        # Recursively reconstruct all semesters (and their nested modules/exams)
-        obj.semesters = [from_dict_hook(sem_dict) for sem_dict in d['semesters']]
+def _build_module(d: dict) -> CourseModule:
+    """
+    Reconstruct a CourseModule and its exams from a serialized dictionary.
+    
+    Args:
+        d: Dictionary produced by CourseModule.to_dict (without '__class__')
+        
+    Returns:
+        CourseModule: The reconstructed module
+    """
+    # Create module with basic metadata; saved data was validated on entry
+    obj = CourseModule._unchecked(
+        name=d['name'], 
+        credits=d['credits'], 
+        planned_semester=d['planned_semester']
+    )
+    # Reconstruct and add all exams (status will be calculated dynamically)
+    # We use append instead of add_exam to avoid attempt validation during deserialization
+    exams = obj.exams
+    for exam_dict in d['exams']:
+        # Exams are the only children whose class varies, look up their builder
+        exam = _BUILDERS[exam_dict.pop('__class__')](exam_dict)
+        exam._module = obj
+        exams.append(exam)
+    # Exams were appended directly, so the cached status must be invalidated
+    obj.invalidate_status()
+    return obj
 
-    # Return the reconstructed object (or None if class_name not recognized)
+def _build_semester(d: dict) -> Semester:
+    """
+    Reconstruct a Semester and its modules from a serialized dictionary.
+    
+    Modules are built directly, without dispatching on their '__class__' tag.
+    
+    Args:
+        d: Dictionary produced by Semester.to_dict (without '__class__')
+        
+    Returns:
+        Semester: The reconstructed semester
+    """
+    # Create semester with semester number (already validated on entry)
+    obj = Semester._unchecked(number=d['number'])
+    for mod_dict in d['modules']:
+        obj.add_module(_build_module(mod_dict))
     return obj
 
+def _build_program(d: dict) -> DegreeProgram:
+    """
+    Reconstruct a DegreeProgram with all nested semesters from a serialized dictionary.
+    
+    Semesters are built directly, without dispatching on their '__class__' tag.
+    
+    Args:
+        d: Dictionary produced by DegreeProgram.to_dict (without '__class__')
+        
+    Returns:
+        DegreeProgram: The reconstructed program
+    """
+    # Create program with metadata; validation already ran when it was created
+    obj = DegreeProgram._unchecked(
+        name=d['name'],
+        target_semesters=d['target_semesters'],
+        target_grade=d['target_grade']
+    )
+    # Reconstruct all semesters (and their nested modules/exams)
+    for sem_dict in d['semesters']:
+        obj.add_semester(_build_semester(sem_dict))
+    return obj
+
+# Builders by serialized '__class__' tag, each taking the dictionary without the tag
+_BUILDERS = {
+    "WrittenExam": lambda d: _finish_exam(WrittenExam(exam_date=_parse_date(d['exam_date'])), d),
+    "Portfolio": lambda d: _finish_exam(Portfolio(exam_date=_parse_date(d['exam_date'])), d),
+    "CaseStudyExam": lambda d: _finish_exam(CaseStudyExam(exam_date=_parse_date(d['exam_date'])), d),
+    "OralExam": lambda d: _finish_exam(OralExam(exam_date=_parse_date(d['exam_date'])), d),
+    "CourseModule": _build_module,
+    "Semester": _build_semester,
+    "DegreeProgram": _build_program,
+}
+
 class DataManager:
     """
     Service class responsible for persisting and loading academic program data.
@@ -112,17 +172,19 @@ class DataManager:
     and deserialization through the custom object hook system.
     """
 
-    def save_program(self, program: DegreeProgram, filepath: str):
+    def save_program(self, program: DegreeProgram, filepath: str, pretty: bool = False):
         """
         Save a complete DegreeProgram object hierarchy to a JSON file.
         
         This method converts the entire program structure (including all
         semesters, modules, and exams) into a JSON-serializable format
-        and writes it to the specified file with proper encoding.
+        and writes it to the specified file with proper encoding. The output
+        is compact by default, which is smaller and faster to write and read.
         
         Args:
             program: The DegreeProgram object to save
             filepath: Path where the JSON file should be saved
+            pretty: Indent the output for human readers (e.g. for debugging)
             
         Raises:
             IOError: If file cannot be written
@@ -131,9 +193,17 @@ class DataManager:
         # Convert program to dictionary representation using entity's to_dict methods
         program_dict = program.to_dict()
         
-        # Write to file with UTF-8 encoding and pretty formatting
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(program_dict, f, indent=4, ensure_ascii=False)
+        # Write to file with UTF-8 encoding, indented only if requested
+        if orjson is not None:
+            # orjson already produces UTF-8 bytes, write them without re-encoding
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(program_dict, option=orjson.OPT_INDENT_2 if pretty else None))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(program_dict, f, indent=4, ensure_ascii=False)
+                else:
+                    json.dump(program_dict, f, separators=(',', ':'), ensure_ascii=False)
 
     def load_program(self, filepath: str) -> DegreeProgram | None:
         """
@@ -152,13 +222,18 @@ class DataManager:
         """
         try:
             # Read and parse JSON file with custom object reconstruction
-            with open(filepath, 'r', encoding='utf-8') as f:
-                program_dict = json.load(f)
-                return from_dict_hook(program_dict)
+            if orjson is not None:
+                # orjson parses bytes directly and raises a JSONDecodeError subclass
+                with open(filepath, 'rb') as f:
+                    program_dict = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    program_dict = json.load(f)
+            return from_dict_hook(program_dict)
         except FileNotFoundError:
             # File doesn't exist - this is normal for new installations
             return None
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
-            # Handle corrupted or invalid JSON data gracefully
+        except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+            # Handle corrupted or invalid JSON data (or out-of-range values) gracefully
             print(f"Error loading or parsing data: {e}")
             return None
\ No newline at end of file
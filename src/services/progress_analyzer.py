@@ -11,6 +11,19 @@ from src.entities.exam import ExamStatus
 from src.entities.program import DegreeProgram
 from src.entities.module import CourseModule, ModuleStatus, MAX_ATTEMPTS
 
+# Risk check per module status, called with (module, current_semester).
+# Statuses without an entry (PASSED) never pose a risk.
+_RISK_PREDICATES = {
+    # Critical risk: Module permanently failed (no more attempts)
+    ModuleStatus.NO_MORE_ATTEMPTS: lambda module, current_semester: True,
+    # High risk: Module failed but can still be retried
+    ModuleStatus.FAILED: lambda module, current_semester: True,
+    # Medium risk: Planned modules that should have been started by now
+    ModuleStatus.PLANNED: lambda module, current_semester: module.planned_semester < current_semester,
+    # Medium risk: Modules in progress with very few attempts remaining (last chance)
+    ModuleStatus.IN_PROGRESS: lambda module, current_semester: module.remaining_attempts() <= 1,
+}
+
 class ProgressAnalyzer:
     """
     Service class for analyzing academic progress and generating predictions.
@@ -47,18 +60,21 @@ class ProgressAnalyzer:
                 - "Leicht zurückliegend" if slightly behind but recoverable
                 - "Deutlich zurückliegend" if significantly behind schedule
         """
+        # All figures come from the program's cached summary, so repeated
+        # analyses of an unchanged program do not rescan the modules
+        summary = self.program.get_summary()
+        
         # Critical case: degree cannot be completed due to failed modules
-        if not self.program.is_completable():
+        if not summary.is_completable:
             return "[red]KRITISCH - Studium nicht abschließbar[/red]"
         
         # Calculate actual vs expected progress metrics
-        total_credits = sum(m.credits for m in self.program.get_all_modules())
-        earned_credits = sum(m.credits for m in self.program.get_all_modules() 
-                             if m.status == ModuleStatus.PASSED)
+        total_credits = summary.total_credits
+        earned_credits = summary.achieved_credits
         
         # Calculate completion ratios
         completion = earned_credits / total_credits if total_credits > 0 else 0
-        semesters_used = max(1, self.program.current_semester() - 1)
+        semesters_used = max(1, summary.current_semester - 1)
         expected_completion = semesters_used / self.program.target_semesters
         
         # Categorize progress status with tolerance thresholds
@@ -80,13 +96,15 @@ class ProgressAnalyzer:
             Optional[date]: Predicted graduation date, or None if degree
                           cannot be completed due to critical failures
         """
+        summary = self.program.get_summary()
+        
         # Cannot predict graduation if degree is no longer completable
-        if not self.program.is_completable():
+        if not summary.is_completable:
             return None
         
         # Calculate time projection based on remaining semesters
         today = date.today()
-        semesters_left = self.program.target_semesters - self.program.current_semester() + 1
+        semesters_left = self.program.target_semesters - summary.current_semester + 1
         
         # Standard academic semester duration (6 months = ~180 days)
         days_per_semester = 180
@@ -106,26 +124,12 @@ class ProgressAnalyzer:
         Returns:
             List[CourseModule]: All modules identified as presenting completion risks
         """
-        risk_modules = []
-        current_semester = self.program.current_semester()
+        current_semester = self.program.get_summary().current_semester
+        predicates = _RISK_PREDICATES
         
-        for module in self.program.get_all_modules():
-            # Critical risk: Module permanently failed (no more attempts)
-            if module.status == ModuleStatus.NO_MORE_ATTEMPTS:
-                risk_modules.append(module)
-            
-            # High risk: Module failed but can still be retried
-            elif module.status == ModuleStatus.FAILED:
-                risk_modules.append(module)
-            
-            # Medium risk: Planned modules that should have been started by now
-            elif (module.status == ModuleStatus.PLANNED and 
-                  module.planned_semester < current_semester):
-                risk_modules.append(module)
-            
-            # Medium risk: Modules in progress with very few attempts remaining
-            elif (module.status == ModuleStatus.IN_PROGRESS and
-                  module.remaining_attempts() <= 1):  # Last chance
-                risk_modules.append(module)
-                
-        return risk_modules
\ No newline at end of file
+        # Look up the check for each module's status; passed modules have none
+        return [
+            module for module in self.program.get_all_modules()
+            if (is_risk := predicates.get(module.status)) is not None
+            and is_risk(module, current_semester)
+        ]
@@ -4,18 +4,82 @@ capturing user input in the console.
 """
 from datetime import date
 from typing import List
-from rich.console import Console
+from rich.console import Group
 from rich.panel import Panel
+from rich.markup import escape
 from rich.text import Text
+from rich.styled import Styled
 from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn
+from rich.progress_bar import ProgressBar
 
 # Import entity classes and validation helpers
 from src.entities.exam import ExamStatus
-from src.entities.program import DegreeProgram
+from src.entities.program import DegreeProgram, ProgramSummary
+from src.utils.console import console
 from src.utils.validation import get_validated_input
 from src.entities.module import CourseModule, ModuleStatus, MAX_ATTEMPTS
 
+# Static blocks, parsed from markup once at import and printed in a single call
+_MAIN_MENU = Text.from_markup(
+    "\n[bold]Hauptmenü:[/bold]\n"
+    "  [1] Neues Modul hinzufügen\n"
+    "  [2] Neue Prüfungsleistung eintragen\n"
+    "  [3] Modulübersicht anzeigen\n"
+    "  [4] Analyse\n"
+    "  [5] Studiengang anlegen/überschreiben\n"
+    "  [6] Beenden"
+)
+_DASHBOARD_TITLE = "Studien-Dashboard"
+# Shown instead of the dashboard while no program exists
+_WELCOME_PANEL = Panel(
+    Text(
+        "Willkommen! Es sind noch keine Studiendaten vorhanden.\n"
+        "Bitte legen Sie einen neuen Studiengang an.",
+        justify="center"
+    ),
+    title=_DASHBOARD_TITLE,
+    border_style="blue",
+    expand=False
+)
+# Display names of the module statuses, a plain dict lookup instead of the Enum.name property
+_STATUS_NAMES = {status: status.name for status in ModuleStatus}
+# Markup of the attempts cell per module status. Only planned modules have no
+# exams yet; every other status has used at least one attempt (warning).
+_ATTEMPT_FMT = {
+    ModuleStatus.NO_MORE_ATTEMPTS: "[red]{used}/{max}[/red]",  # Critical
+    ModuleStatus.PLANNED: "{used}/{max}",                       # Normal
+}
+_ATTEMPT_FMT_DEFAULT = "[yellow]{used}/{max}[/yellow]"          # Warning
+
+_NEW_PROGRAM_HEADER = Text.from_markup("\n[bold blue]Neuen Studiengang anlegen[/bold blue]")
+_NEW_MODULE_HEADER = Text.from_markup("\n[bold blue]Neues Modul hinzufügen[/bold blue]")
+_CRITICAL_SOLUTIONS = Text.from_markup(
+    "\n[bold]Mögliche Lösungen:[/bold]\n"
+    "- Studiengang wechseln\n"
+    "- Studienabbruch erwägen\n"
+    "- Mit Studienberatung sprechen"
+)
+# Caption line below the analysis progress bar, filled in with one format_map call
+_LABELS_TMPL = "{pad1}Aktuell ({earned}/{total} ECTS){pad2}│ Erwartet (Semester {used}/{target})"
+
+def _risk_problem(module: CourseModule, current_semester: int) -> str:
+    """
+    Describe why a module is listed as a risk in the analysis.
+    
+    Args:
+        module: A module identified as a risk (not permanently failed)
+        current_semester: The program's current semester
+        
+    Returns:
+        str: Short problem description for the risk table
+    """
+    status = module.status
+    if status is ModuleStatus.FAILED:
+        return f"Nicht bestanden ({module.remaining_attempts()} Versuch(e) übrig)"
+    if status is ModuleStatus.PLANNED and module.planned_semester < current_semester:
+        return "Nicht begonnen (überfällig)"
+    return f"Nur noch {module.remaining_attempts()} Versuch(e)"
+
 class DashboardUI:
     """
     User interface service managing all console interactions and display formatting.
@@ -33,7 +97,10 @@ class DashboardUI:
         The Rich Console enables colored text, tables, progress bars, and other
         visual enhancements that improve the user experience.
         """
-        self.console = Console()
+        # Shared with the input validation, see src/utils/console.py
+        self.console = console
+        # Last dashboard panel as (program, key, panel), reused while the program is unchanged
+        self._dashboard_cache = None
 
     def display_dashboard(self, program: DegreeProgram | None):
         """
@@ -52,80 +119,96 @@ class DashboardUI:
         Args:
             program: The current degree program, or None if no data exists
         """
-        title = "Studien-Dashboard"
+        title = _DASHBOARD_TITLE
 
         # Handle case where no program data exists yet
         if program is None:
-            content = Text(
-                "Willkommen! Es sind noch keine Studiendaten vorhanden.\n"
-                "Bitte legen Sie einen neuen Studiengang an.",
-                justify="center"
-            )
-            panel = Panel(content, title=title, border_style="blue", expand=False)
+            renderable = _WELCOME_PANEL
         else:
-            # Collect key metrics and statistics for display
-            current_sem = program.current_semester()
-            avg_grade = program.get_average_grade()
-            all_modules = program.get_all_modules()
-            total_credits = sum(module.credits for module in all_modules)
-            achieved_credits = sum(module.credits for module in all_modules if module.is_passed())
-            critical_failures = program.get_critical_failures()
-            is_completable = program.is_completable()
-            
-            # Build text with KPI info
-            content = Text(justify="left")
-            content.append("Studiengang: ", style="bold")
-            content.append(f"{program.name}\n", style="green")
-            content.append("Aktuelles Semester: ")
-            content.append(f"{current_sem}\n", style="cyan")
-            content.append("Ziel-Notendurchschnitt: ")
-            content.append(f"{program.target_grade}\n", style="magenta")
-            content.append("Aktueller Durchschnitt: ")
-            content.append(f"{avg_grade if avg_grade is not None else '-'}\n", style="yellow")
-            content.append("Erreichte Credits: ")
-            content.append(f"{achieved_credits} / {total_credits}\n", style="green")
+            # Collect key metrics and statistics for display (cached by the program)
+            summary = program.get_summary()
+            total_credits = summary.total_credits
+            achieved_credits = summary.achieved_credits
             
-            # Critical failures warning
-            if critical_failures:
-                warning_text = Text.from_markup(
-                "[bold red]KRITISCHER FEHLER:[/bold red] "
-                "Studium kann nicht abgeschlossen werden!\n"
+            # Reuse the last panel if neither the program nor its settings changed
+            key = (program.revision, program.name, program.target_grade)
+            cached = self._dashboard_cache
+            if cached is not None and cached[0] is program and cached[1] == key:
+                panel = cached[2]
+            else:
+                panel = self._build_dashboard_panel(program, summary, title)
+                self._dashboard_cache = (program, key, panel)
+
+            # Add a simple horizontal progress bar for credits, rendered once
+            # as a static row instead of through a live Progress display
+            percentage = min(100.0, achieved_credits / total_credits * 100.0) if total_credits else 0.0
+            credit_bar = Table.grid(padding=(0, 1))
+            credit_bar.add_row(
+                "Fortschritt:",
+                ProgressBar(total=total_credits, completed=achieved_credits, width=30),
+                f"{percentage:>3.0f}%"
             )
-                content.append("\n")    
-                content.append(warning_text)
+            # Progress row and panel are rendered together
+            renderable = Group(credit_bar, panel)
 
-                for module in critical_failures:
-                    content.append(f" - {module.name} (3x nicht bestanden)\n", style="red")
-            
-            # Degree completion status
-            status_style = "red" if not is_completable else "green"
-            status_text = "NICHT ABSCHLIESSBAR" if not is_completable else "ABSCHLIESSBAR"
-            content.append("\nStudienabschluss: ")
-            content.append(status_text + "\n", style=f"bold {status_style}")
+        # Render the whole dashboard in a single print
+        self.console.print(renderable)
 
-            # Add a simple horizontal progress bar for credits
-            progress_bar = Progress(
-                "{task.description}",
-                BarColumn(bar_width=30),
-                TextColumn("{task.percentage:>3.0f}%"),
-                expand=False,
-                console=self.console
+    def _build_dashboard_panel(self, program: DegreeProgram, summary: ProgramSummary, title: str) -> Panel:
+        """
+        Build the dashboard panel with the key figures of a program.
+        
+        Args:
+            program: The current degree program
+            summary: The program's ProgramSummary
+            title: Panel title
+            
+        Returns:
+            Panel: The rendered dashboard panel
+        """
+        current_sem = summary.current_semester
+        avg_grade = summary.average_grade
+        total_credits = summary.total_credits
+        achieved_credits = summary.achieved_credits
+        critical_failures = program.get_critical_failures()
+        is_completable = summary.is_completable
+        
+        # Build the KPI text as one markup string, parsed in a single pass;
+        # user-entered names are escaped so they cannot inject markup
+        status_style = "red" if not is_completable else "green"
+        status_text = "NICHT ABSCHLIESSBAR" if not is_completable else "ABSCHLIESSBAR"
+        markup = (
+            f"[bold]Studiengang: [/bold][green]{escape(program.name)}\n[/green]"
+            f"Aktuelles Semester: [cyan]{current_sem}\n[/cyan]"
+            f"Ziel-Notendurchschnitt: [magenta]{program.target_grade}\n[/magenta]"
+            f"Aktueller Durchschnitt: [yellow]{avg_grade if avg_grade is not None else '-'}\n[/yellow]"
+            f"Erreichte Credits: [green]{achieved_credits} / {total_credits}\n[/green]"
+        )
+        
+        # Critical failures warning
+        if critical_failures:
+            markup += (
+                "\n[bold red]KRITISCHER FEHLER:[/bold red] "
+                "Studium kann nicht abgeschlossen werden!\n"
             )
-            task_id = progress_bar.add_task("Fortschritt:", total=total_credits, completed=achieved_credits)
-            with progress_bar:
-                progress_bar.refresh()  # render bar once
-
-            # Wrap the text and bar in a panel
-            panel_border_style = "red" if critical_failures else "green"
-            panel = Panel(
-                content,
-                title=title,
-                border_style=panel_border_style,
-                width=60,
-                expand=False
+            markup += "".join(
+                f"[red] - {escape(module.name)} (3x nicht bestanden)\n[/red]"
+                for module in critical_failures
             )
+        
+        # Degree completion status
+        markup += f"\nStudienabschluss: [bold {status_style}]{status_text}\n[/bold {status_style}]"
+        content = Text.from_markup(markup, justify="left")
 
-        self.console.print(panel)
+        # Wrap the text in a panel
+        panel_border_style = "red" if critical_failures else "green"
+        return Panel(
+            content,
+            title=title,
+            border_style=panel_border_style,
+            width=60,
+            expand=False
+        )
 
     def display_main_menu(self) -> str:
         """
@@ -137,15 +220,10 @@ class DashboardUI:
         Returns:
             str: The user's menu choice as a string
         """
-        self.console.print("\n[bold]Hauptmenü:[/bold]")
-        self.console.print("  [1] Neues Modul hinzufügen")
-        self.console.print("  [2] Neue Prüfungsleistung eintragen")
-        self.console.print("  [3] Modulübersicht anzeigen")
-        self.console.print("  [4] Analyse")
-        self.console.print("  [5] Studiengang anlegen/überschreiben")
-        self.console.print("  [6] Beenden")
-        
-        choice = self.console.input("\nBitte wähle eine Option: ")
+        self.console.print(_MAIN_MENU)
+        
+        # Plain prompt without markup, the builtin input avoids the rich render pass
+        choice = input("\nBitte wähle eine Option: ")
         return choice
     
     def get_new_program_data(self) -> dict:
@@ -159,10 +237,10 @@ class DashboardUI:
         Returns:
             dict: Dictionary containing program name, target semesters, and target grade
         """
-        self.console.print("\n[bold blue]Neuen Studiengang anlegen[/bold blue]")
+        self.console.print(_NEW_PROGRAM_HEADER)
         
         # Collect basic program information with examples
-        name = self.console.input("Name des Studiengangs (z.B. Computer Science): ")
+        name = input("Name des Studiengangs (z.B. Computer Science): ")
         target_semesters = get_validated_input("Geplante Semesteranzahl (z.B. 6): ", int)
         target_grade = get_validated_input("Ziel-Notendurchschnitt (z.B. 2.0): ", float)
         
@@ -182,10 +260,10 @@ class DashboardUI:
         Returns:
             dict: Dictionary containing module name, credits, and semester assignment
         """
-        self.console.print("\n[bold blue]Neues Modul hinzufügen[/bold blue]")
+        self.console.print(_NEW_MODULE_HEADER)
         
         # Collect module details with validation
-        name = self.console.input("Name des Moduls: ")
+        name = input("Name des Moduls: ")
         credits = get_validated_input("Anzahl ECTS-Punkte: ", int)
         semester_num = get_validated_input("Zu welchem Semester hinzufügen (z.B. 1): ", int)
         
@@ -202,46 +280,51 @@ class DashboardUI:
         Args:
             program: The degree program containing modules to display
         """
-        # Create table with appropriate columns and styling
-        table = Table(title="Modulübersicht", border_style="blue", show_header=True, header_style="bold magenta")
-        
-        table.add_column("Semester", justify="center")
-        table.add_column("Modulname", style="cyan", no_wrap=True)
-        table.add_column("ECTS", justify="right")
-        table.add_column("Status", justify="center")
-        table.add_column("Versuche", justify="center")
-        table.add_column("Beste Note", justify="right", style="green")
-
-        # Handle empty program case
+        # Handle empty program case before building anything
         if not program.semesters:
             self.console.print("[yellow]Es sind noch keine Semester oder Module vorhanden.[/yellow]")
             return
         
-        # Populate table with module data from all semesters
+        # Collect the row data of all modules from all semesters
+        rows = []
         for semester in program.semesters:
+            semester_str = str(semester.number)
             for module in semester.modules:
                 # Format grade display
                 grade = module.best_grade()
                 grade_str = f"{grade:.1f}" if grade is not None else "-"
                 
                 # Format attempt status with color coding for risk levels
-                if module.status == ModuleStatus.NO_MORE_ATTEMPTS:
-                    attempts = f"[red]{len(module.exams)}/{MAX_ATTEMPTS}[/red]"  # Critical
-                elif module.remaining_attempts() < MAX_ATTEMPTS:
-                    attempts = f"[yellow]{len(module.exams)}/{MAX_ATTEMPTS}[/yellow]"  # Warning
-                else:
-                    attempts = f"{len(module.exams)}/{MAX_ATTEMPTS}"  # Normal
+                status = module.status
+                attempts = _ATTEMPT_FMT.get(status, _ATTEMPT_FMT_DEFAULT).format(
+                    used=len(module.exams), max=MAX_ATTEMPTS
+                )
                 
-                # Add row with all module information
-                table.add_row(
-                    str(semester.number),
+                rows.append((
+                    semester_str,
                     module.name,
                     str(module.credits),
-                    module.status.name,
+                    _STATUS_NAMES[status],
                     attempts,
                     grade_str
-                )
-                
+                ))
+        
+        # Create table with appropriate columns and styling
+        table = Table(title="Modulübersicht", border_style="blue", show_header=True, header_style="bold magenta")
+        
+        table.add_column("Semester", justify="center")
+        table.add_column("Modulname", style="cyan", no_wrap=True)
+        table.add_column("ECTS", justify="right")
+        table.add_column("Status", justify="center")
+        table.add_column("Versuche", justify="center")
+        table.add_column("Beste Note", justify="right", style="green")
+        
+        # Bind the method once, the loop only unpacks the prebuilt rows
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+        
+        # Render the whole table in a single print
         self.console.print(table)
     
     def display_analysis(self, program: DegreeProgram, trend: str, grad_date: date, 
@@ -267,14 +350,16 @@ class DashboardUI:
         """
         # Use red borders for critical situations, blue for normal analysis
         border_style = "red" if critical_failures else "blue"
-        self.console.print(Panel("[bold]ANALYSE DES STUDIENVERLAUFS[/bold]", style=border_style))
+        # Collect all blocks and print them as one group, so the screen is
+        # rendered and written in a single pass
+        parts = [Panel("[bold]ANALYSE DES STUDIENVERLAUFS[/bold]", style=border_style)]
         
         # === Critical Failures Section ===
         # Show permanent failures that prevent degree completion
         if critical_failures:
-            self.console.print("\n[bold red on white] KRITISCHE FEHLER [/bold red on white]")
-            self.console.print("Ihr Studium kann nicht abgeschlossen werden, da folgende Module\n"
-                            "definitiv nicht bestanden wurden (3 Versuche gescheitert):", style="bold red")
+            parts.append("\n[bold red on white] KRITISCHE FEHLER [/bold red on white]")
+            parts.append(Styled("Ihr Studium kann nicht abgeschlossen werden, da folgende Module\n"
+                                "definitiv nicht bestanden wurden (3 Versuche gescheitert):", "bold red"))
             
             crit_table = Table(show_header=True, header_style="bold red")
             crit_table.add_column("Modul", style="red")
@@ -288,24 +373,23 @@ class DashboardUI:
                     str(module.planned_semester)
                 )
             
-            self.console.print(crit_table)
-            self.console.print("\n[bold]Mögliche Lösungen:[/bold]")
-            self.console.print("- Studiengang wechseln")
-            self.console.print("- Studienabbruch erwägen")
-            self.console.print("- Mit Studienberatung sprechen")
+            parts.append(crit_table)
+            parts.append(_CRITICAL_SOLUTIONS)
         
         # Progress Summary section
         summary_table = Table(show_header=False, box=None, padding=(0, 2))
         summary_table.add_column(style="bold", justify="right")
         summary_table.add_column(style="")
         
-        # Get progress data for visualization
-        all_modules = program.get_all_modules()
-        total_credits = sum(m.credits for m in all_modules)
-        earned_credits = sum(m.credits for m in all_modules if m.status == ModuleStatus.PASSED)
+        # Get progress data for visualization from the program's cached summary,
+        # which the dashboard has usually computed already
+        summary = program.get_summary()
+        total_credits = summary.total_credits
+        earned_credits = summary.achieved_credits
+        current_semester = summary.current_semester
         completion = earned_credits / total_credits if total_credits > 0 else 0
         
-        semesters_used = max(1, program.current_semester() - 1)
+        semesters_used = max(1, current_semester - 1)
         expected_completion = semesters_used / program.target_semesters
         
         # Create visual progress bar
@@ -313,23 +397,28 @@ class DashboardUI:
         actual_pos = min(int(completion * bar_length), bar_length)
         expected_pos = min(int(expected_completion * bar_length), bar_length)
         
-        progress_bar = ""
-        for i in range(bar_length):
-            if i < actual_pos:
-                progress_bar += "█"  # Completed portion
-            elif i == actual_pos and actual_pos < expected_pos:
-                progress_bar += "▌"  # Current position marker
-            elif i == expected_pos:
-                progress_bar += "│"  # Expected position marker
-            else:
-                progress_bar += " "  # Not yet completed
-        
-        # Add labels to the progress bar
-        progress_bar += "\n"
-        progress_bar += " " * actual_pos + "▲" + " " * max(0, expected_pos - actual_pos - 1)
-        progress_bar += "\n"
-        progress_bar += " " * actual_pos + f"Aktuell ({earned_credits}/{total_credits} ECTS)"
-        progress_bar += " " * max(0, expected_pos - actual_pos - 15) + f"│ Erwartet (Semester {semesters_used}/{program.target_semesters})"
+        # Completed portion, then the not yet completed rest
+        bar = ["█"] * actual_pos + [" "] * (bar_length - actual_pos)
+        if actual_pos < expected_pos:
+            bar[actual_pos] = "▌"  # Current position marker
+        if actual_pos <= expected_pos < bar_length:
+            bar[expected_pos] = "│"  # Expected position marker
+        
+        # Add labels below the bar: a marker line and a caption line
+        indent = " " * actual_pos
+        gap = expected_pos - actual_pos
+        progress_bar = "\n".join((
+            "".join(bar),
+            f"{indent}▲{' ' * max(0, gap - 1)}",
+            _LABELS_TMPL.format_map({
+                "pad1": indent,
+                "earned": earned_credits,
+                "total": total_credits,
+                "pad2": " " * max(0, gap - 15),
+                "used": semesters_used,
+                "target": program.target_semesters,
+            }),
+        ))
         
         # Add to summary
         summary_table.add_row("ECTS-Verlauf:", progress_bar)
@@ -339,12 +428,14 @@ class DashboardUI:
         else:
             summary_table.add_row("Vorauss. Abschluss:", "[red]Nicht möglich[/red]")
         
-        self.console.print(summary_table)
+        parts.append(summary_table)
         
         # Risk Modules section (only if there are any non-critical risk modules)
-        non_critical_risk = [m for m in risk_modules if m not in critical_failures]
+        # Modules compare by identity, so a set gives constant-time membership tests
+        critical = set(critical_failures)
+        non_critical_risk = [m for m in risk_modules if m not in critical]
         if non_critical_risk:
-            self.console.print("\n[bold]RISIKOMODULE[/bold]")
+            parts.append("\n[bold]RISIKOMODULE[/bold]")
             risk_table = Table(show_header=True, header_style="bold")
             risk_table.add_column("Modul", style="cyan")
             risk_table.add_column("Status", style="bold")
@@ -352,27 +443,22 @@ class DashboardUI:
             risk_table.add_column("Versuche", justify="center")
             risk_table.add_column("Problem", style="red")
             
-            for module in non_critical_risk:
-                # Format attempts
-                attempts = f"{len(module.exams)}/{MAX_ATTEMPTS}"
-                
-                # Determine problem
-                if module.status == ModuleStatus.FAILED:
-                    problem = f"Nicht bestanden ({module.remaining_attempts()} Versuch(e) übrig)"
-                elif module.status == ModuleStatus.PLANNED and module.planned_semester < program.current_semester():
-                    problem = "Nicht begonnen (überfällig)"
-                else:
-                    problem = f"Nur noch {module.remaining_attempts()} Versuch(e)"
-                
-                risk_table.add_row(
+            rows = [
+                (
                     module.name,
-                    module.status.name,
+                    _STATUS_NAMES[module.status],
                     str(module.planned_semester),
-                    attempts,
-                    problem
+                    f"{len(module.exams)}/{MAX_ATTEMPTS}",
+                    _risk_problem(module, current_semester)
                 )
-            self.console.print(risk_table)
+                for module in non_critical_risk
+            ]
+            for row in rows:
+                risk_table.add_row(*row)
+            parts.append(risk_table)
         elif risk_modules:  # only critical failures were shown
             pass
         else:
-            self.console.print("\n[green]Keine weiteren Risikomodule identifiziert[/green]")
\ No newline at end of file
+            parts.append("\n[green]Keine weiteren Risikomodule identifiziert[/green]")
+        
+        self.console.print(Group(*parts))
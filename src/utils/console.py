@@ -0,0 +1,10 @@
+"""
+Shared Rich console for all console output of the dashboard.
+
+The UI service and the input validation print through this single
+instance, so terminal detection runs once and all output goes through
+the same stream. Console-wide settings belong here.
+"""
+from rich.console import Console
+
+console = Console()
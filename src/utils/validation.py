@@ -7,13 +7,23 @@ typing to maintain type safety while providing flexible validation
 for different data types (int, float, etc.).
 """
 from typing import Type, TypeVar
-from rich.console import Console
+from src.utils.console import console
 
 # Generic type variable for maintaining type safety across different input types
 T = TypeVar('T')  # Represents any type that can be validated (int, float, str, etc.)
 
-# Rich console instance for formatted user interaction and error messages
-console = Console()
+def _is_plain_int(text: str) -> bool:
+    """Check whether text is an unsigned ASCII integer such as '6'."""
+    return text.isascii() and text.isdigit()
+
+def _is_plain_float(text: str) -> bool:
+    """Check whether text is an unsigned ASCII decimal such as '2' or '2.3'."""
+    return text.isascii() and text.replace('.', '', 1).isdigit()
+
+# Checks for input that is known to convert without error, so the common
+# case skips the try/except below. isdigit alone also accepts non-ASCII
+# digits like '²' that int() rejects, hence the isascii guard.
+_FAST_PATH = {int: _is_plain_int, float: _is_plain_float}
 
 def get_validated_input(prompt: str, target_type: Type[T]) -> T:
     """
@@ -50,9 +60,16 @@ def get_validated_input(prompt: str, target_type: Type[T]) -> T:
         This function will loop indefinitely until valid input is provided.
         The target_type must support construction from string (e.g., int("5")).
     """
+    is_plain = _FAST_PATH.get(target_type)
+    # Prompts without markup are read with the builtin input, skipping Rich's render pass
+    read = console.input if '[' in prompt else input
     while True:
         # Get user input as string
-        user_input = console.input(prompt)
+        user_input = read(prompt)
+        
+        # Plain numbers convert directly; signs, spaces and exponents go the long way
+        if is_plain is not None and is_plain(user_input):
+            return target_type(user_input)
         
         try:
             # Attempt type conversion using the target type's constructor
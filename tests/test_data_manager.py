@@ -1,5 +1,8 @@
+import io
 import unittest
 import os
+from contextlib import redirect_stdout
+import tempfile
 from datetime import date
 from src.services.data_manager import DataManager
 from src.entities.program import DegreeProgram
@@ -9,21 +12,28 @@ from src.entities.exam import WrittenExam
 
 class TestDataManager(unittest.TestCase):
 
-    def setUp(self):
-        self.manager = DataManager()
-        self.filepath = "test_program.json"
-        self.program = DegreeProgram("TestProg", 1, 2.0)
+    @classmethod
+    def setUpClass(cls):
+        # Shared read-only fixture, the tests only save and compare it
+        cls.program = DegreeProgram("TestProg", 1, 2.0)
         semester = Semester(1)
         module = CourseModule("Mathe", 5, 1)
         exam = WrittenExam(date(2024,7,20))
         exam.record_result(2.0)
         module.add_exam(exam)
         semester.add_module(module)
-        self.program.add_semester(semester)
+        cls.program.add_semester(semester)
+        # Test files go to a temporary directory that is removed with all its contents
+        cls._tmp = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
 
-    def tearDown(self):
-        if os.path.exists(self.filepath):
-            os.remove(self.filepath)
+    def setUp(self):
+        self.manager = DataManager()
+        # One file per test, so no test sees another's data
+        self.filepath = os.path.join(self._tmp.name, self._testMethodName + ".json")
 
     def test_save_and_load_roundtrip(self):
         self.manager.save_program(self.program, self.filepath)
@@ -31,10 +41,30 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(loaded.name, self.program.name)
         self.assertEqual(loaded.get_average_grade(), self.program.get_average_grade())
 
+    def test_pretty_and_compact_output_load_the_same(self):
+        self.manager.save_program(self.program, self.filepath)
+        compact_size = os.path.getsize(self.filepath)
+        self.manager.save_program(self.program, self.filepath, pretty=True)
+        self.assertGreater(os.path.getsize(self.filepath), compact_size)
+        loaded = self.manager.load_program(self.filepath)
+        self.assertEqual(loaded.get_average_grade(), self.program.get_average_grade())
+
     def test_load_nonexistent_file(self):
-        loaded = self.manager.load_program("nonexistent_file.json")
+        loaded = self.manager.load_program(os.path.join(self._tmp.name, "nonexistent_file.json"))
         self.assertIsNone(loaded)
 
+    def test_load_out_of_range_values(self):
+        for content in (
+            '{"__class__": "DegreeProgram", "name": "X", "target_semesters": 0, "target_grade": 2.0, "semesters": []}',
+            '{"__class__": "DegreeProgram", "name": "X", "target_semesters": 6, "target_grade": 2.0, '
+            '"semesters": [{"__class__": "Semester", "number": -1, "modules": []}]}',
+        ):
+            with self.subTest(content=content):
+                with open(self.filepath, "w") as f:
+                    f.write(content)
+                with redirect_stdout(io.StringIO()):
+                    self.assertIsNone(self.manager.load_program(self.filepath))
+
     def test_load_corrupt_file(self):
         with open(self.filepath, "w") as f:
             f.write("{ invalid json")
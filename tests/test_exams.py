@@ -1,33 +1,71 @@
 import unittest
 from datetime import date
-from src.entities.exam import WrittenExam, Portfolio, CaseStudyExam, OralExam, ExamStatus, StateError
+from src.entities.exam import Exam, ExamType, WrittenExam, Portfolio, CaseStudyExam, OralExam, ExamStatus, StateError
 
-class TestExamLifecycle(unittest.TestCase):
+# Each exam type with a sample date; tests build only the exams they use.
+# Dates are immutable, so they are created once and shared by all tests.
+EXAM_DATES = {
+    WrittenExam: date(2023, 12, 15),
+    Portfolio: date(2023, 11, 20),
+    CaseStudyExam: date(2023, 10, 10),
+    OralExam: date(2023, 9, 5),
+}
+# Grades around the pass threshold and the status every exam type should get
+GRADE_TABLE = [
+    (1.0, ExamStatus.PASSED),
+    (4.0, ExamStatus.PASSED),
+    (4.1, ExamStatus.FAILED),
+    (5.0, ExamStatus.FAILED),
+]
 
-    def setUp(self):
-        self.written_exam = WrittenExam(date(2023, 12, 15))
-        self.portfolio = Portfolio(date(2023, 11, 20))
-        self.case_study = CaseStudyExam(date(2023, 10, 10))
-        self.oral_exam = OralExam(date(2023, 9, 5))
+class TestExamLifecycle(unittest.TestCase):
 
     def test_initial_state(self):
-        for exam in [self.written_exam, self.portfolio, self.case_study, self.oral_exam]:
-            self.assertIsNone(exam.grade)
-            self.assertEqual(exam.status, ExamStatus.PLANNED)
+        for exam_cls, exam_date in EXAM_DATES.items():
+            with self.subTest(exam=exam_cls.__name__):
+                exam = exam_cls(exam_date)
+                self.assertIsNone(exam.grade)
+                self.assertEqual(exam.status, ExamStatus.PLANNED)
 
     def test_record_result_valid(self):
-        self.written_exam.record_result(2.0)
-        self.assertEqual(self.written_exam.grade, 2.0)
-        self.assertEqual(self.written_exam.status, ExamStatus.PASSED)
+        exam = WrittenExam(EXAM_DATES[WrittenExam])
+        exam.record_result(2.0)
+        self.assertEqual(exam.grade, 2.0)
+        self.assertEqual(exam.status, ExamStatus.PASSED)
+
+    def test_record_result_invalid(self):
+        for grade in (0.7, 5.3, float('nan')):
+            with self.subTest(grade=grade):
+                exam = WrittenExam(EXAM_DATES[WrittenExam])
+                with self.assertRaises(ValueError):
+                    exam.record_result(grade)
+                self.assertIsNone(exam.grade)
+                self.assertEqual(exam.status, ExamStatus.PLANNED)
 
     def test_pass_conditions(self):
-        self.portfolio.record_result(3.5)
-        self.assertEqual(self.portfolio.status, ExamStatus.PASSED)
-        self.case_study.record_result(4.0)
-        self.assertEqual(self.case_study.status, ExamStatus.PASSED)
-        self.oral_exam.record_result(5.0)
-        self.assertEqual(self.oral_exam.status, ExamStatus.FAILED)
+        cases = [
+            (Portfolio, 3.5, ExamStatus.PASSED),
+            (CaseStudyExam, 4.0, ExamStatus.PASSED),
+            (OralExam, 5.0, ExamStatus.FAILED),
+        ]
+        for exam_cls, grade, expected in cases:
+            with self.subTest(exam=exam_cls.__name__, grade=grade):
+                exam = exam_cls(EXAM_DATES[exam_cls])
+                exam.record_result(grade)
+                self.assertEqual(exam.status, expected)
+
+    def test_grade_table_for_all_exam_types(self):
+        for exam_cls, exam_date in EXAM_DATES.items():
+            for grade, expected in GRADE_TABLE:
+                with self.subTest(exam=exam_cls.__name__, grade=grade):
+                    exam = exam_cls(exam_date)
+                    exam.record_result(grade)
+                    self.assertEqual(exam.status, expected)
+
+    def test_base_class_cannot_be_instantiated(self):
+        with self.assertRaises(TypeError):
+            Exam(ExamType.WRITTEN, EXAM_DATES[WrittenExam])
 
     def test_is_passed_without_result(self):
         with self.assertRaises(StateError):
-            _ = self.written_exam.is_passed()
\ No newline at end of file
+            _ = WrittenExam(EXAM_DATES[WrittenExam]).is_passed()
@@ -3,6 +3,9 @@ from datetime import date
 from src.entities.module import CourseModule, ModuleStatus
 from src.entities.exam import WrittenExam, ExamStatus
 
+# Shared exam date, created once since dates are immutable
+EXAM_DATE = date(2023,12,15)
+
 class TestCourseModule(unittest.TestCase):
 
     def setUp(self):
@@ -11,23 +14,26 @@ class TestCourseModule(unittest.TestCase):
     def test_initial_status(self):
         self.assertEqual(self.module.status, ModuleStatus.PLANNED)
 
-    def test_status_in_progress(self):
-        exam = WrittenExam(date(2023,12,15))
-        exam.record_result(5.0)
-        self.module.add_exam(exam)
-        self.assertEqual(self.module.status, ModuleStatus.FAILED)
+    def test_module_after_grades(self):
+        # Grades of consecutive attempts -> expected module status and best grade
+        cases = [
+            ([5.0], ModuleStatus.FAILED, None),
+            ([2.0], ModuleStatus.PASSED, 2.0),
+            ([3.0, 2.0], ModuleStatus.PASSED, 2.0),
+        ]
+        for grades, expected_status, expected_best in cases:
+            with self.subTest(grades=grades):
+                module = CourseModule("Mathe", 5, 1)
+                for day, grade in enumerate(grades, start=15):
+                    exam = WrittenExam(date(2023,12,day))
+                    exam.record_result(grade)
+                    module.add_exam(exam)
+                self.assertEqual(module.status, expected_status)
+                self.assertEqual(module.best_grade(), expected_best)
 
-    def test_status_passed(self):
-        exam = WrittenExam(date(2023,12,15))
-        exam.record_result(2.0)
+    def test_status_refreshes_when_added_exam_is_graded(self):
+        exam = WrittenExam(EXAM_DATE)
         self.module.add_exam(exam)
+        self.assertEqual(self.module.status, ModuleStatus.IN_PROGRESS)
+        exam.record_result(1.7)
         self.assertEqual(self.module.status, ModuleStatus.PASSED)
-
-    def test_best_grade(self):
-        exam1 = WrittenExam(date(2023,12,15))
-        exam1.record_result(3.0)
-        exam2 = WrittenExam(date(2023,12,16))
-        exam2.record_result(2.0)
-        self.module.add_exam(exam1)
-        self.module.add_exam(exam2)
-        self.assertEqual(self.module.best_grade(), 2.0)
\ No newline at end of file
@@ -5,13 +5,16 @@ from src.entities.semester import Semester
 from src.entities.module import CourseModule
 from src.entities.exam import WrittenExam
 
+# Exam date of the setUp fixture, created once since dates are immutable
+EXAM_DATE = date(2023,12,15)
+
 class TestDegreeProgram(unittest.TestCase):
 
     def setUp(self):
         self.program = DegreeProgram("TestProg", target_semesters=2, target_grade=2.0)
         semester1 = Semester(1)
         mod = CourseModule("Mathe", 5, 1)
-        exam = WrittenExam(date(2023,12,15))
+        exam = WrittenExam(EXAM_DATE)
         exam.record_result(2.0)
         mod.add_exam(exam)
         semester1.add_module(mod)
@@ -23,4 +26,88 @@ class TestDegreeProgram(unittest.TestCase):
 
     def test_current_semester_logic(self):
         current = self.program.current_semester()
-        self.assertEqual(current, 2)
\ No newline at end of file
+        self.assertEqual(current, 2)
+
+    def test_all_modules_include_later_additions(self):
+        self.assertEqual(len(self.program.get_all_modules()), 1)
+        self.program.semesters[0].add_module(CourseModule("Physik", 5, 1))
+        semester2 = Semester(2)
+        semester2.add_module(CourseModule("Informatik", 5, 2))
+        self.program.add_semester(semester2)
+        names = [m.name for m in self.program.get_all_modules()]
+        self.assertEqual(names, ["Mathe", "Physik", "Informatik"])
+
+    def test_summary_refreshes_after_changes(self):
+        summary = self.program.get_summary()
+        self.assertEqual((summary.achieved_credits, summary.total_credits), (5, 5))
+        mod = CourseModule("Physik", 5, 2)
+        semester2 = Semester(2)
+        semester2.add_module(mod)
+        self.program.add_semester(semester2)
+        self.assertEqual(self.program.get_summary().total_credits, 10)
+        exam = WrittenExam(date(2024,2,1))
+        mod.add_exam(exam)
+        exam.record_result(3.0)
+        summary = self.program.get_summary()
+        self.assertEqual(summary.achieved_credits, 10)
+        self.assertEqual(summary.average_grade, 2.5)
+
+    def test_summary_matches_individual_calculations(self):
+        semester2 = Semester(2)
+        failed = CourseModule("Physik", 4, 2)
+        for day in (1, 2, 3):
+            exam = WrittenExam(date(2024,2,day))
+            exam.record_result(5.0)
+            failed.add_exam(exam)
+        semester2.add_module(failed)
+        semester2.add_module(CourseModule("Informatik", 6, 2))
+        self.program.add_semester(semester2)
+        summary = self.program.get_summary()
+        self.assertEqual(summary.current_semester, self.program.current_semester())
+        self.assertEqual(summary.average_grade, self.program.get_average_grade())
+        self.assertEqual(summary.is_completable, self.program.is_completable())
+        self.assertFalse(summary.is_completable)
+        self.assertEqual((summary.achieved_credits, summary.total_credits), (5, 15))
+
+    def test_get_semester_by_number(self):
+        semester3 = Semester(3)
+        self.program.add_semester(semester3)
+        self.assertIs(self.program.get_semester(3), semester3)
+        self.assertIs(self.program.get_semester(1), self.program.semesters[0])
+        self.assertIsNone(self.program.get_semester(2))
+
+    def test_get_semester_returns_first_of_duplicate_numbers(self):
+        first = self.program.semesters[0]
+        self.program.add_semester(Semester(1))
+        self.assertIs(self.program.get_semester(1), first)
+
+    def test_semesters_stay_in_chronological_order(self):
+        for number in (4, 2, 3):
+            self.program.add_semester(Semester(number))
+        self.assertEqual([s.number for s in self.program.semesters], [1, 2, 3, 4])
+
+    def test_eligible_modules_exclude_passed_and_exhausted(self):
+        semester2 = Semester(2)
+        exhausted = CourseModule("Physik", 5, 2)
+        for day in (1, 2, 3):
+            exam = WrittenExam(date(2024,2,day))
+            exam.record_result(5.0)
+            exhausted.add_exam(exam)
+        open_module = CourseModule("Informatik", 5, 2)
+        semester2.add_module(exhausted)
+        semester2.add_module(open_module)
+        self.program.add_semester(semester2)
+        self.assertEqual(self.program.get_eligible_modules(), [open_module])
+
+    def test_revision_changes_with_program_content(self):
+        revision = self.program.revision
+        module = CourseModule("Physik", 5, 1)
+        self.program.semesters[0].add_module(module)
+        self.assertGreater(self.program.revision, revision)
+        revision = self.program.revision
+        exam = WrittenExam(date(2024,2,1))
+        module.add_exam(exam)
+        self.assertGreater(self.program.revision, revision)
+        revision = self.program.revision
+        exam.record_result(2.3)
+        self.assertGreater(self.program.revision, revision)
@@ -0,0 +1,102 @@
+import unittest
+from datetime import date, timedelta
+from src.services.progress_analyzer import ProgressAnalyzer, _RISK_PREDICATES
+from src.entities.program import DegreeProgram
+from src.entities.semester import Semester
+from src.entities.module import CourseModule, ModuleStatus
+from src.entities.exam import WrittenExam
+
+class TestProgressAnalyzer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # The analyzer only reads the program, so all tests share one instance
+        cls.program = DegreeProgram("TestProg", target_semesters=3, target_grade=2.0)
+        semester1 = Semester(1)
+        cls.passed = CourseModule("Mathe", 5, 1)
+        cls._add_exams(cls.passed, 2.0)
+        cls.failed = CourseModule("Physik", 5, 1)
+        cls._add_exams(cls.failed, 5.0)
+        cls.no_more_attempts = CourseModule("Chemie", 5, 1)
+        cls._add_exams(cls.no_more_attempts, 5.0, 5.0, None)
+        # In progress with one failed attempt, only one attempt left
+        cls.last_attempt = CourseModule("Biologie", 5, 1)
+        cls._add_exams(cls.last_attempt, 5.0, None)
+        # In progress with its first attempt, two attempts left
+        cls.in_progress = CourseModule("Englisch", 5, 1)
+        cls._add_exams(cls.in_progress, None)
+        for module in (cls.passed, cls.failed, cls.no_more_attempts, cls.last_attempt, cls.in_progress):
+            semester1.add_module(module)
+        semester2 = Semester(2)
+        cls.planned = CourseModule("Informatik", 5, 2)
+        semester2.add_module(cls.planned)
+        cls.program.add_semester(semester1)
+        cls.program.add_semester(semester2)
+        cls.analyzer = ProgressAnalyzer(cls.program)
+
+    @staticmethod
+    def _add_exams(module, *grades):
+        for day, grade in enumerate(grades, start=1):
+            exam = WrittenExam(date(2024,2,day))
+            if grade is not None:
+                exam.record_result(grade)
+            module.add_exam(exam)
+
+    def test_fixture_statuses(self):
+        expected = [
+            (self.passed, ModuleStatus.PASSED),
+            (self.failed, ModuleStatus.FAILED),
+            (self.no_more_attempts, ModuleStatus.NO_MORE_ATTEMPTS),
+            (self.last_attempt, ModuleStatus.IN_PROGRESS),
+            (self.in_progress, ModuleStatus.IN_PROGRESS),
+            (self.planned, ModuleStatus.PLANNED),
+        ]
+        for module, status in expected:
+            with self.subTest(module=module.name):
+                self.assertEqual(module.status, status)
+
+    def test_identify_risk_modules(self):
+        # Current semester is 1, so the planned module of semester 2 is not overdue;
+        # of the modules in progress only the one on its last attempt is a risk
+        self.assertEqual(self.analyzer.identify_risk_modules(),
+                         [self.failed, self.no_more_attempts, self.last_attempt])
+
+    def test_overdue_planned_module_is_a_risk(self):
+        # Within a program the current semester is the earliest one with an
+        # open module, so a planned module cannot fall behind it there; the
+        # predicate is checked directly for a module planned before it
+        is_risk = _RISK_PREDICATES[ModuleStatus.PLANNED]
+        self.assertTrue(is_risk(CourseModule("Statistik", 5, 1), 2))
+        self.assertFalse(is_risk(CourseModule("Statistik", 5, 2), 2))
+
+    @classmethod
+    def _build_program(cls, target_semesters, modules):
+        # modules: (credits, planned_semester, grades) per module
+        program = DegreeProgram("TestProg", target_semesters=target_semesters, target_grade=2.0)
+        semesters = {}
+        for index, (credits, planned, grades) in enumerate(modules):
+            module = CourseModule(f"Modul {index}", credits, planned)
+            cls._add_exams(module, *grades)
+            if planned not in semesters:
+                semesters[planned] = Semester(planned)
+                program.add_semester(semesters[planned])
+            semesters[planned].add_module(module)
+        return program
+
+    def test_trend_and_graduation_for_critical_program(self):
+        self.assertEqual(self.analyzer.calculate_ects_trend(), "[red]KRITISCH - Studium nicht abschließbar[/red]")
+        self.assertIsNone(self.analyzer.predict_graduation())
+
+    def test_trend_and_graduation(self):
+        # (target semesters, modules, expected trend, semesters left)
+        cases = [
+            (3, [(5, 1, [2.0]), (5, 1, [5.0]), (5, 2, [])], "Im Plan", 3),
+            (2, [(5, 1, [2.0]), (5, 1, [5.0]), (10, 1, [5.0]), (5, 2, [2.0])], "Leicht zurückliegend", 2),
+            (4, [(5, 1, [2.0]), (20, 3, [])], "Deutlich zurückliegend", 2),
+        ]
+        for target_semesters, modules, expected_trend, semesters_left in cases:
+            with self.subTest(expected_trend=expected_trend):
+                analyzer = ProgressAnalyzer(self._build_program(target_semesters, modules))
+                self.assertEqual(analyzer.calculate_ects_trend(), expected_trend)
+                self.assertEqual(analyzer.predict_graduation(),
+                                 date.today() + timedelta(days=180 * semesters_left))
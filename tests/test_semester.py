@@ -1,3 +1,4 @@
+import copy
 import unittest
 from datetime import date
 
@@ -5,24 +6,48 @@ from src.entities.semester import Semester
 from src.entities.module import CourseModule
 from src.entities.exam import WrittenExam
 
+# Exam dates of the setUp fixture, created once since dates are immutable
+FIRST_EXAM_DATE = date(2023,10,1)
+SECOND_EXAM_DATE = date(2023,10,2)
+
 class TestSemester(unittest.TestCase):
 
-    def setUp(self):
-        self.semester = Semester(1)
+    @classmethod
+    def setUpClass(cls):
+        # Prototype semester, built once; each test works on its own deep copy
+        cls.prototype = Semester(1)
         mod1 = CourseModule("Mathe", 5, 1)
         mod2 = CourseModule("Englisch", 3, 1)
-        exam1 = WrittenExam(date(2023,10,1))
+        exam1 = WrittenExam(FIRST_EXAM_DATE)
         exam1.record_result(2.0)
-        exam2 = WrittenExam(date(2023,10,2))
+        exam2 = WrittenExam(SECOND_EXAM_DATE)
         exam2.record_result(3.0)
         mod1.add_exam(exam1)
         mod2.add_exam(exam2)
-        self.semester.add_module(mod1)
-        self.semester.add_module(mod2)
+        cls.prototype.add_module(mod1)
+        cls.prototype.add_module(mod2)
+
+    def setUp(self):
+        self.semester = copy.deepcopy(self.prototype)
 
     def test_credit_calculation(self):
         self.assertEqual(self.semester.total_credits(), 8)
 
+    def test_copy_keeps_back_references(self):
+        module = self.semester.modules[0]
+        self.assertIsNot(module, self.prototype.modules[0])
+        self.assertIs(module._semester, self.semester)
+        self.assertIs(module.exams[0]._module, module)
+
+    def test_achieved_credits_count_only_passed_modules(self):
+        failed_mod = CourseModule("Physik", 4, 1)
+        exam = WrittenExam(date(2023,10,3))
+        exam.record_result(5.0)
+        failed_mod.add_exam(exam)
+        self.semester.add_module(failed_mod)
+        self.assertEqual(self.semester.get_achieved_credits(), 8)
+        self.assertEqual(self.semester.total_credits(), 12)
+
     def test_empty_semester_has_zero_credits(self):
         empty_semester = Semester(2)
         self.assertEqual(empty_semester.total_credits(), 0)
@@ -39,8 +64,7 @@ class TestSemester(unittest.TestCase):
         exam.record_result(5.0)  # failed
         mod.add_exam(exam)
         semester.add_module(mod)
-        passed = [m for m in semester.modules if m.is_passed()]
-        self.assertEqual(len(passed), 0)
+        self.assertFalse(any(m.is_passed() for m in semester.modules))
 
     def test_semester_with_all_modules_failed(self):
         semester = Semester(3)
@@ -54,10 +78,14 @@ class TestSemester(unittest.TestCase):
         mod2.add_exam(exam2)
         semester.add_module(mod1)
         semester.add_module(mod2)
-        failed = [m for m in semester.modules if not m.is_passed()]
-        self.assertEqual(len(failed), 2)
+        self.assertEqual(len(semester.modules), 2)
+        self.assertTrue(all(not m.is_passed() for m in semester.modules))
 
     def test_add_same_module_twice(self):
-        mod = CourseModule("Mathe", 5, 1)
+        # Semesters do not deduplicate, the same object is stored twice.
+        # Known limitation: its credits are then counted twice as well, so
+        # the credit totals are deliberately not asserted here.
+        mod = CourseModule("Physik", 4, 1)
+        self.semester.add_module(mod)
         self.semester.add_module(mod)
-        self.assertEqual(len(self.semester.modules), 3)
\ No newline at end of file
+        self.assertEqual(len(self.semester.modules), 4)
\ No newline at end of file
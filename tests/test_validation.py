@@ -0,0 +1,27 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src.utils.validation import get_validated_input
+
+class TestValidatedInput(unittest.TestCase):
+
+    def ask(self, answers, target_type):
+        # Feed the answers in order and hide prompts and error messages
+        with patch('builtins.input', side_effect=answers), redirect_stdout(io.StringIO()):
+            return get_validated_input("Wert: ", target_type)
+
+    def test_plain_numbers(self):
+        self.assertEqual(self.ask(["6"], int), 6)
+        self.assertEqual(self.ask(["2.3"], float), 2.3)
+        self.assertEqual(self.ask(["2"], float), 2.0)
+
+    def test_other_valid_formats(self):
+        self.assertEqual(self.ask([" 7 "], int), 7)
+        self.assertEqual(self.ask(["-3"], int), -3)
+        self.assertEqual(self.ask(["1e1"], float), 10.0)
+
+    def test_invalid_input_is_asked_again(self):
+        self.assertEqual(self.ask(["abc", "²", "4"], int), 4)
+        self.assertEqual(self.ask(["1.2.3", "1,5", "1.5"], float), 1.5)